@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+
+import sys
+import time
+
+from ft_plant_growth import GardenSimulation, Plant, np
+
+
+def make_plants(n_plants: int) -> list[Plant]:
+    """
+    Creates n_plants plants with varied heights and lifetimes.
+    """
+    return [Plant(f"plant_{i}", i % 100, i % 365) for i in range(n_plants)]
+
+
+def bench_growth(n_plants: int, days: int = 365) -> None:
+    """
+    Times the day-by-day object loop against the array simulation and
+    checks that both report the same plants.
+    """
+    backend = "NumPy" if np is not None else "array"
+    print(f"=== {n_plants} plants x {days} days ({backend}) ===")
+    sample = min(n_plants, 20_000)
+    plants = make_plants(sample)
+    start = time.perf_counter()
+    for _ in range(days):
+        for plant in plants:
+            plant.grow()
+            plant.age()
+    elapsed = time.perf_counter() - start
+    print(
+        f"{'object loop':<14} {elapsed:.3f} s for {sample} plants",
+        f"(~{elapsed * n_plants / sample:.1f} s for {n_plants})"
+    )
+
+    garden = GardenSimulation.from_plants(make_plants(n_plants))
+    start = time.perf_counter()
+    garden.advance(days)
+    print(f"{'simulation':<14} {time.perf_counter() - start:.3f} s")
+    assert all(garden.get_info(i) == plant.get_info()
+               for i, plant in enumerate(plants))
+
+
+if __name__ == "__main__":
+    bench_growth(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
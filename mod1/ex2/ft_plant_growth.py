@@ -1,5 +1,13 @@
 #!/usr/bin/env python3
 
+from array import array
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
 class Plant:
     """
     Acts as a blueprint for Plant objects.
@@ -31,6 +39,77 @@ class Plant:
         return f"{self.name}: {self.height}cm, {self.lifetime} days old"
 
 
+class GardenSimulation:
+    """
+    Simulates many plants at once, storing every height and lifetime in
+    an array instead of one Plant object per plant.
+
+    Advancing N days is a single addition over each array, done with
+    NumPy when it is installed.
+    """
+    def __init__(self, names: list[str], heights: list[int],
+                 lifetimes: list[int]) -> None:
+        """
+        Constructs a simulation from parallel lists of plant data.
+        """
+        self.names = names
+        self.initial_heights = array("q", heights)
+        if np is not None:
+            self.heights = np.array(heights, dtype=np.int64)
+            self.lifetimes = np.array(lifetimes, dtype=np.int64)
+        else:
+            self.heights = array("q", heights)
+            self.lifetimes = array("q", lifetimes)
+
+    @classmethod
+    def from_plants(cls, plants: list[Plant]) -> "GardenSimulation":
+        """
+        Constructs a simulation holding the state of existing plants.
+        """
+        return cls(
+            [plant.name for plant in plants],
+            [plant.height for plant in plants],
+            [plant.lifetime for plant in plants]
+        )
+
+    def advance(self, days: int) -> None:
+        """
+        Grows and ages every plant by the given number of days, as
+        calling grow() and age() once per day would.
+        """
+        if np is not None:
+            self.heights += days
+            self.lifetimes += days
+        else:
+            self.heights = array("q", [h + days for h in self.heights])
+            self.lifetimes = array("q", [t + days for t in self.lifetimes])
+
+    def get_info(self, index: int) -> str:
+        """
+        Displays the current status of a plant, like Plant.get_info.
+        """
+        return (
+            f"{self.names[index]}: {self.heights[index]}cm, "
+            f"{self.lifetimes[index]} days old"
+        )
+
+    def growth(self, index: int) -> int:
+        """
+        Returns how much a plant grew since the simulation started.
+        """
+        return int(self.heights[index]) - self.initial_heights[index]
+
+    def to_plants(self) -> list[Plant]:
+        """
+        Returns Plant objects holding the current state of every plant.
+        """
+        return [
+            Plant(name, int(height), int(lifetime))
+            for name, height, lifetime
+            in zip(self.names, self.heights, self.lifetimes)
+        ]
+
+
 def main() -> None:
     """
     Orchestrates the plant growth simulation.
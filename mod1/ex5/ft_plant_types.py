@@ -3,7 +3,11 @@
 class Plant:
     """
     Acts as a blueprint for all plant types.
+
+    Uses __slots__ so instances carry no per-instance __dict__.
     """
+    __slots__ = ("name", "height", "age")
+
     def __init__(self, name: str, height: int, age: int) -> None:
         """
         Initializes common attributes for any plant.
@@ -24,6 +28,8 @@ class Flower(Plant):
     """
     Represents a specialized Plant type: Flower.
     """
+    __slots__ = ("color",)
+
     def __init__(self, name: str, height: int, age: int, color: str) -> None:
         """
         Initializes a Flower with an additional color attribute.
@@ -49,6 +55,8 @@ class Tree(Plant):
     """
     Represents a specialized Plant type: Tree.
     """
+    __slots__ = ("trunk_diameter",)
+
     def __init__(
         self,
         name: str,
@@ -81,6 +89,8 @@ class Vegetable(Plant):
     """
     Represents a specialized Plant type: Vegetable.
     """
+    __slots__ = ("harvest_season", "nutritional_value")
+
     def __init__(
         self,
         name: str,
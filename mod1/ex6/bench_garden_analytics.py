@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+
+import ast
+import sys
+import time
+import tracemalloc
+from types import ModuleType
+from typing import Any
+
+import ft_garden_analytics
+
+
+def load_without_slots() -> ModuleType:
+    """
+    Loads a second copy of ft_garden_analytics whose classes have their
+    __slots__ removed, so every plant carries a __dict__ again.
+
+    Returns the copied module.
+    """
+    with open(ft_garden_analytics.__file__, encoding="utf-8") as file:
+        tree = ast.parse(file.read())
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ClassDef):
+            node.body = [
+                stmt for stmt in node.body
+                if not (isinstance(stmt, ast.Assign)
+                        and [ast.unparse(t) for t in stmt.targets]
+                        == ["__slots__"])
+            ]
+    module = ModuleType("ft_garden_analytics_dict")
+    exec(compile(tree, ft_garden_analytics.__file__, "exec"),
+         module.__dict__)
+    return module
+
+
+def build_garden(module: ModuleType, names: list[str]) -> tuple[Any, int]:
+    """
+    Fills a Garden of the module with one PrizeFlower per name.
+
+    Returns the garden and the memory its plants hold.
+    """
+    garden = module.Garden("bench")
+    tracemalloc.start()
+    garden.plants = [module.PrizeFlower(name, i % 100, "red", i % 10)
+                     for i, name in enumerate(names)]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return garden, size
+
+
+def time_garden(garden: Any) -> tuple[float, float]:
+    """
+    Times one grow() call per plant, then Garden.get_score().
+
+    Returns both durations.
+    """
+    start = time.perf_counter()
+    for plant in garden.plants:
+        plant.grow()
+    grow_time = time.perf_counter() - start
+    start = time.perf_counter()
+    garden.get_score()
+    return grow_time, time.perf_counter() - start
+
+
+def main(n_plants: int, rounds: int = 5) -> None:
+    """
+    Compares slotted plants with the same classes without __slots__.
+
+    Displays memory per plant (names excluded, both share them) and
+    the best grow()/get_score() times over rounds, alternating which
+    variant runs first.
+    """
+    print(f"=== {n_plants} prize flowers, best of {rounds} rounds ===")
+    variants = [("dict", load_without_slots()),
+                ("slots", ft_garden_analytics)]
+    names = [f"plant_{i}" for i in range(n_plants)]
+    gardens = {}
+    for label, module in variants:
+        gardens[label], size = build_garden(module, names)
+        print(f"{label:<6} {size / n_plants:6.1f} B/plant")
+    best = {label: [float("inf")] * 2 for label, _ in variants}
+    for i in range(rounds):
+        order = variants if i % 2 == 0 else variants[::-1]
+        for label, _ in order:
+            times = time_garden(gardens[label])
+            best[label] = list(map(min, best[label], times))
+    for label, (grow_time, score_time) in best.items():
+        print(
+            f"{label:<6} grow {grow_time:.3f} s,",
+            f"get_score {score_time:.3f} s"
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
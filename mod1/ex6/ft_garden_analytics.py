@@ -3,7 +3,11 @@
 class Plant:
     """
     Acts as a blueprint for Plant objects.
+
+    Uses __slots__ so instances carry no per-instance __dict__.
     """
+    __slots__ = ("name", "height", "growth_amount")
+
     def __init__(self, name: str, height: int) -> None:
         """
         Initializes common attributes for any plant.
@@ -33,6 +37,8 @@ class FloweringPlant(Plant):
     """
     Acts as a blueprint for FloweringPlant objects.
     """
+    __slots__ = ("color",)
+
     def __init__(self, name: str, height: int, color: str) -> None:
         """
         Calls parent __init__ method for common attributes.
@@ -54,6 +60,8 @@ class PrizeFlower(FloweringPlant):
     """
     Acts as a blueprint for PrizeFlower objects.
     """
+    __slots__ = ("prize",)
+
     def __init__(self, name: str, height: int, color: str, prize: int) -> None:
         """
         Calls parent __init__ method for common attributes.
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+
+import io
+import sys
+import time
+from contextlib import redirect_stdout
+
+from ft_command_quest import format_arguments, write_stdin_arguments
+
+
+def print_per_line(args: list[str]) -> None:
+    """
+    Displays each argument with its own print call.
+    """
+    i = 1
+    for arg in args:
+        print(f"Argument {i}: {arg}")
+        i += 1
+
+
+def bench_output(n_args: int) -> None:
+    """
+    Compares per-line printing with a single joined write, and times
+    the batched stdin path, all writing to an in-memory buffer.
+    """
+    print(f"=== Argument output ({n_args} arguments) ===")
+    args = [f"arg_{i}" for i in range(n_args)]
+    stdin = "".join(f"{arg}\n" for arg in args)
+    runs = [
+        ("print per line", lambda: print_per_line(args)),
+        ("joined write", lambda: sys.stdout.write(format_arguments(args))),
+        ("stdin batches",
+         lambda: write_stdin_arguments(io.StringIO(stdin), sys.stdout))
+    ]
+    base = 0.0
+    for name, run in runs:
+        buffer = io.StringIO()
+        start = time.perf_counter()
+        with redirect_stdout(buffer):
+            run()
+        elapsed = time.perf_counter() - start
+        base = base or elapsed
+        print(f"{name:<16} {elapsed:.3f} s, x{base / elapsed:.1f}")
+
+
+if __name__ == "__main__":
+    bench_output(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
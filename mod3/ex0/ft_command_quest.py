@@ -1,23 +1,74 @@
 #!/usr/bin/env python3
 
+import io
 import sys
+from itertools import repeat
+from shutil import copyfileobj
+from tempfile import SpooledTemporaryFile
+from typing import IO, Iterable, TextIO
+
+# Approximate number of characters read per batch when streaming stdin
+BATCH_SIZE = 1 << 20
+
+
+def format_arguments(args: Iterable[str], start: int = 1) -> str:
+    """
+    Formats one "Argument i: arg" line per argument, numbered from start.
+
+    Returns all the lines as a single str.
+    """
+    return "".join(
+        f"Argument {i}: {arg}\n" for i, arg in enumerate(args, start)
+    )
+
+
+def write_stdin_arguments(stream: TextIO, out: IO[str]) -> int:
+    """
+    Reads arguments from stream, one per line, and writes them to out
+    in large batches.
+
+    Returns the number of arguments read.
+    """
+    count = 0
+    while batch := stream.readlines(BATCH_SIZE):
+        out.write(format_arguments(map(str.rstrip, batch, repeat("\n")),
+                                   count + 1))
+        count += len(batch)
+    return count
+
+
+def print_quest(count: int, arguments: IO[str]) -> None:
+    """
+    Displays the program name, the argument count and the formatted
+    argument lines read from arguments.
+    """
+    if count == 0:
+        print("No arguments provided!")
+    print(f"Program name: {sys.argv[0]}")
+    if count > 0:
+        print(f"Arguments received: {count}")
+        copyfileobj(arguments, sys.stdout)
+    print(f"Total arguments: {count + 1}")
 
 
 def main() -> None:
     """
     Displays command-line arguments and the total count.
+
+    With --stdin, the arguments are read from stdin, one per line. Their
+    lines are spooled (to a temporary file once large) until the count
+    is known, so the output keeps the same order as with argv.
     """
     print("=== Command Quest ===")
-    if len(sys.argv) == 1:
-        print("No arguments provided!")
-    print(f"Program name: {sys.argv[0]}")
-    if len(sys.argv) > 1:
-        print(f"Arguments received: {len(sys.argv) - 1}")
-        i = 1
-        for arg in sys.argv[1:]:
-            print(f"Argument {i}: {arg}")
-            i += 1
-    print(f"Total arguments: {len(sys.argv)}")
+    if sys.argv[1:] == ["--stdin"]:
+        with SpooledTemporaryFile(max_size=BATCH_SIZE, mode="w+",
+                                  encoding="utf-8") as spool:
+            count = write_stdin_arguments(sys.stdin, spool)
+            spool.seek(0)
+            print_quest(count, spool)
+        return
+    print_quest(len(sys.argv) - 1,
+                io.StringIO(format_arguments(sys.argv[1:])))
 
 
 if __name__ == "__main__":
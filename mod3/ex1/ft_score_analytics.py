@@ -1,6 +1,168 @@
 #!/usr/bin/env python3
 
+import math
+import random
 import sys
+from typing import Iterable, Iterator, TextIO
+
+USAGE = (
+    "Usage: python3 ft_score_analytics.py <score1> <score2> ...\n"
+    "       python3 ft_score_analytics.py --file <path>\n"
+    "       python3 ft_score_analytics.py - (scores read from stdin)"
+)
+
+# Characters read at a time when streaming scores
+CHUNK_SIZE = 1 << 20
+
+
+class ScoreStats:
+    """
+    Running score statistics with bounded memory.
+
+    Count, total, min and max are exact. Percentiles come from a fixed
+    size uniform sample of the scores (reservoir sampling, Algorithm L),
+    so they are exact up to sample_size scores and approximate after.
+    """
+
+    def __init__(self, sample_size: int = 10_000,
+                 seed: int | None = None) -> None:
+        """
+        Creates empty statistics keeping at most sample_size scores.
+
+        Raises ValueError if sample_size is below 1.
+        """
+        if sample_size < 1:
+            raise ValueError(f"invalid sample size {sample_size}")
+        self.count = 0
+        self.total = 0
+        self.low: int | None = None
+        self.high: int | None = None
+        self.sample_size = sample_size
+        self.sample: list[int] = []
+        self.rng = random.Random(seed)
+        self.weight = 1.0
+        self.next_pick = 0
+
+    def add_many(self, scores: list[int]) -> None:
+        """
+        Adds a batch of scores.
+        """
+        if not scores:
+            return
+        start = self.count
+        self.count += len(scores)
+        self.total += sum(scores)
+        low, high = min(scores), max(scores)
+        if self.low is None or low < self.low:
+            self.low = low
+        if self.high is None or high > self.high:
+            self.high = high
+        taken = min(len(scores), self.sample_size - len(self.sample))
+        if taken > 0:
+            self.sample.extend(scores[:taken])
+            if len(self.sample) == self.sample_size:
+                self.next_pick = self.sample_size - 1
+                self._skip()
+        full = len(self.sample) == self.sample_size
+        while full and self.next_pick < self.count:
+            index = self.rng.randrange(self.sample_size)
+            self.sample[index] = scores[self.next_pick - start]
+            self._skip()
+
+    def _skip(self) -> None:
+        """
+        Draws how many scores to pass over before the next replacement.
+        """
+        self.weight *= math.exp(
+            math.log(1.0 - self.rng.random()) / self.sample_size
+        )
+        gap = math.log(1.0 - self.rng.random()) / math.log1p(-self.weight)
+        self.next_pick += math.floor(gap) + 1
+
+    @property
+    def average(self) -> float:
+        """
+        Average score.
+        """
+        return self.total / self.count
+
+    def percentile(self, percent: float) -> int:
+        """
+        Returns the score below which percent % of the scores fall
+        (nearest rank on the sample).
+        """
+        ordered = sorted(self.sample)
+        rank = math.ceil(percent / 100 * len(ordered))
+        return ordered[min(max(rank, 1), len(ordered)) - 1]
+
+
+def parse_scores(tokens: list[str]) -> list[int]:
+    """
+    Converts tokens to ints in bulk, falling back to one at a time to
+    report the invalid ones.
+
+    Returns the valid scores.
+    """
+    try:
+        return list(map(int, tokens))
+    except ValueError:
+        scores = []
+        for token in tokens:
+            try:
+                scores.append(int(token))
+            except ValueError:
+                print(f"Error: {token} is not a valid score.")
+        return scores
+
+
+def read_scores(stream: TextIO, chunk_size: int = CHUNK_SIZE
+                ) -> Iterator[list[int]]:
+    """
+    Yields batches of whitespace separated scores read from a stream,
+    keeping a score cut between two reads for the next batch.
+    """
+    pending = ""
+    for chunk in iter(lambda: stream.read(chunk_size), ""):
+        tokens = (pending + chunk).split()
+        pending = ""
+        if tokens and not chunk[-1].isspace():
+            pending = tokens.pop()
+        yield parse_scores(tokens)
+    if pending:
+        yield parse_scores([pending])
+
+
+def summarize(batches: Iterable[list[int]]) -> ScoreStats | None:
+    """
+    Computes statistics over batches of scores in one pass.
+
+    Returns the statistics, or None without any score.
+    """
+    stats = ScoreStats()
+    for batch in batches:
+        stats.add_many(batch)
+    return stats if stats.count else None
+
+
+def print_stream_analytics(stream: TextIO) -> None:
+    """
+    Processes scores read from a stream and displays them.
+    """
+    stats = summarize(read_scores(stream))
+    if stats is None or stats.high is None or stats.low is None:
+        print("No scores provided.")
+        return
+    print(f"Total players: {stats.count}")
+    print(f"Total score: {stats.total}")
+    print(f"Average score: {stats.average}")
+    print(f"High score: {stats.high}")
+    print(f"Low score: {stats.low}")
+    print(f"Score range: {stats.high - stats.low}")
+    approx = " (approx.)" if stats.count > stats.sample_size else ""
+    print(
+        f"Percentiles{approx}: p50={stats.percentile(50)},",
+        f"p90={stats.percentile(90)}, p99={stats.percentile(99)}"
+    )
 
 
 def main() -> None:
@@ -8,26 +170,34 @@ def main() -> None:
     Processes scores and displays them.
     """
     print("=== Player Score Analytics ===")
-    scores: list[int] = []
-    arg = None
-    for arg in sys.argv[1:]:
+    args = sys.argv[1:]
+    if args == ["-"]:
+        print_stream_analytics(sys.stdin)
+        return
+    if args[:1] == ["--file"]:
+        if len(args) != 2:
+            print(USAGE)
+            return
         try:
-            scores.append(int(arg))
-        except ValueError:
-            print(f"Error: {arg} is not a valid score.")
+            with open(args[1], encoding="utf-8") as file:
+                print_stream_analytics(file)
+        except OSError as e:
+            print(f"Error: cannot read {args[1]}: {e.strerror}")
+        return
+    scores = parse_scores(args)
     if not scores:
-        print(
-            "No scores provided.",
-            "Usage: python3 ft_score_analytics.py <score1> <score2> ..."
-        )
+        print("No scores provided.", USAGE)
     else:
+        total = sum(scores)
+        high = max(scores)
+        low = min(scores)
         print(f"Scores processed: {scores}")
         print(f"Total players: {len(scores)}")
-        print(f"Total score: {sum(scores)}")
-        print(f"Average score: {sum(scores) / len(scores)}")
-        print(f"High score: {max(scores)}")
-        print(f"Low score: {min(scores)}")
-        print(f"Score range: {max(scores) - min(scores)}")
+        print(f"Total score: {total}")
+        print(f"Average score: {total / len(scores)}")
+        print(f"High score: {high}")
+        print(f"Low score: {low}")
+        print(f"Score range: {high - low}")
 
 
 if __name__ == "__main__":
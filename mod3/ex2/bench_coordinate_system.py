@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+
+import math
+import random
+import sys
+import time
+from heapq import nsmallest
+from typing import Any, Callable
+
+from ft_coordinate_system import (
+    Point, SpatialGrid, distances, np, pairwise_distances, parse_batch
+)
+
+
+def timed(label: str, func: Callable[[], Any]) -> Any:
+    """
+    Runs func once and displays how long it took.
+
+    Returns func's result.
+    """
+    start = time.perf_counter()
+    result = func()
+    print(f"{label:<36} {time.perf_counter() - start:.3f} s")
+    return result
+
+
+def bench_coordinates(n_points: int) -> None:
+    """
+    Times bulk parsing and distance computations over n_points points.
+    """
+    backend = "NumPy" if np is not None else "pure Python"
+    print(f"=== Coordinates ({n_points} points, {backend}) ===")
+    rng = random.Random(0)
+    lines = [
+        f"{rng.uniform(-1e3, 1e3):.3f},{rng.uniform(-1e3, 1e3):.3f},"
+        f"{rng.uniform(-1e3, 1e3):.3f}"
+        for _ in range(n_points)
+    ]
+    points = timed("parse_batch", lambda: parse_batch(lines))
+    tuples = [tuple(point) for point in points]
+    timed("distances to origin", lambda: distances(points))
+    timed("distances to reference", lambda: distances(points, (5, 5, 5)))
+    timed("math.dist loop", lambda: [math.dist(p, (0, 0, 0))
+                                     for p in tuples])
+    sample = points[:2000]
+    timed(f"pairwise ({len(sample)} points)",
+          lambda: pairwise_distances(sample))
+
+
+def bench_grid(n_players: int, n_ticks: int = 5) -> None:
+    """
+    Times a tick loop over moving players: every player moves, then
+    100 k-nearest queries run on the grid and by brute force, both
+    inside the player cloud and far outside it.
+    """
+    print(f"\n=== SpatialGrid ({n_players} moving players) ===")
+    rng = random.Random(1)
+    world = 5000.0
+    grid = SpatialGrid(cell_size=50.0)
+    positions = {
+        f"player_{i}": (rng.uniform(0, world), rng.uniform(0, world),
+                        rng.uniform(0, 100))
+        for i in range(n_players)
+    }
+    timed("insert", lambda: [grid.insert(name, point)
+                             for name, point in positions.items()])
+    queries = [(rng.uniform(0, world), rng.uniform(0, world), 50.0)
+               for _ in range(100)]
+    far_queries = [(rng.uniform(2 * world, 4 * world), rng.uniform(0, world),
+                    rng.uniform(-world, 0)) for _ in range(100)]
+
+    def move_all() -> None:
+        for name, (x, y, z) in positions.items():
+            point = (x + rng.uniform(-5, 5), y + rng.uniform(-5, 5), z)
+            positions[name] = point
+            grid.move(name, point)
+
+    def brute_force(points: list[Point]) -> None:
+        for query in points:
+            nsmallest(10, positions.values(),
+                      key=lambda point: math.dist(query, point))
+
+    for tick in range(n_ticks):
+        timed(f"tick {tick}: move all", move_all)
+        for where, points in (("inside", queries), ("outside", far_queries)):
+            timed(f"tick {tick}: 100 x grid 10-NN {where}",
+                  lambda: [grid.nearest(query, 10) for query in points])
+            timed(f"tick {tick}: 100 x brute force 10-NN {where}",
+                  lambda: brute_force(points))
+
+
+if __name__ == "__main__":
+    bench_coordinates(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
+    bench_grid(100_000)
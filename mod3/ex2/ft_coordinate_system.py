@@ -2,6 +2,18 @@
 
 import sys
 import math
+from array import array
+from heapq import nsmallest
+from itertools import product
+from typing import Iterable, Union
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+Point = tuple[float, float, float]
+Points = Union["np.ndarray", list[Point]]
 
 
 def process_coordinates(coord_str: str) -> tuple[float, float, float] | None:
@@ -57,6 +69,255 @@ def unpack_coordinates(coords: tuple[float, float, float]) -> None:
     )
 
 
+def find_bad_line(lines: list[str]) -> str:
+    """
+    Finds the first line that is not three comma-separated floats.
+
+    Returns an error message naming the line.
+    """
+    for i, line in enumerate(lines):
+        values = line.split(",")
+        if len(values) != 3:
+            return f"line {i + 1}: expected 3 values: {line!r}"
+        try:
+            for value in values:
+                float(value)
+        except ValueError:
+            return f"line {i + 1}: invalid float: {line!r}"
+    return "could not convert all coordinates to float"
+
+
+def parse_batch(lines: Iterable[str]) -> Points:
+    """
+    Parses "x,y,z" strings in bulk, without printing anything.
+
+    Returns an N x 3 float array when NumPy is installed, otherwise a
+    list of tuples. Raises ValueError naming the first malformed line.
+    """
+    lines = list(lines)
+    if any(line.count(",") != 2 for line in lines):
+        raise ValueError(find_bad_line(lines))
+    if not lines:
+        return np.empty((0, 3)) if np is not None else []
+    text = ",".join(lines)
+    if np is not None:
+        try:
+            return np.fromstring(text, sep=",").reshape(-1, 3)
+        except ValueError:
+            # NumPy rejects some spellings float() accepts, such as "1_000"
+            pass
+    try:
+        values = array("d", map(float, text.split(",")))
+    except ValueError:
+        raise ValueError(find_bad_line(lines)) from None
+    if np is not None:
+        return np.frombuffer(values).reshape(-1, 3)
+    return list(zip(values[0::3], values[1::3], values[2::3]))
+
+
+def parse_file(path: str) -> Points:
+    """
+    Parses a file with one "x,y,z" coordinate per line.
+
+    Returns the points as parse_batch does.
+    """
+    with open(path, encoding="utf-8") as file:
+        return parse_batch(line.strip() for line in file if line.strip())
+
+
+def distances(points: Points, reference: Point = (0, 0, 0)) -> Points:
+    """
+    Computes the distance from every point to a reference point
+    (default: the origin).
+
+    Returns a NumPy array, or a list of floats without NumPy.
+    """
+    if np is not None:
+        return np.linalg.norm(np.asarray(points) - reference, axis=1)
+    return [math.dist(point, reference) for point in points]
+
+
+def pairwise_distances(points: Points) -> Points:
+    """
+    Computes the distance between every pair of points.
+
+    Returns an N x N NumPy array, or a list of lists without NumPy.
+    Memory grows with N squared, so keep N in the thousands.
+    """
+    if np is not None:
+        coords = np.asarray(points)
+        deltas = coords[:, np.newaxis, :] - coords[np.newaxis, :, :]
+        return np.sqrt((deltas ** 2).sum(axis=2))
+    return [[math.dist(a, b) for b in points] for a in points]
+
+
+class SpatialGrid:
+    """
+    Uniform grid over 3D space indexing player positions by cell, for
+    nearest-neighbor and radius queries that only visit nearby cells.
+
+    bounds is a box of cells holding every player. It only grows while
+    players are in the grid, so it may be larger than needed.
+    """
+
+    def __init__(self, cell_size: float = 10.0) -> None:
+        """
+        Creates an empty grid with cubic cells of the given side.
+        """
+        self.cell_size = cell_size
+        self.positions: dict[str, Point] = {}
+        self.cells: dict[tuple[int, int, int], set[str]] = {}
+        self.bounds: tuple[tuple[int, ...], tuple[int, ...]] | None = None
+
+    def cell(self, point: Point) -> tuple[int, int, int]:
+        """
+        Returns the grid cell containing a point.
+        """
+        x, y, z = point
+        size = self.cell_size
+        return (math.floor(x / size), math.floor(y / size),
+                math.floor(z / size))
+
+    def insert(self, name: str, point: Point) -> None:
+        """
+        Adds a player at a position, or moves it there if present.
+        """
+        if name in self.positions:
+            self.move(name, point)
+            return
+        self.positions[name] = point
+        self._add(self.cell(point), name)
+
+    def move(self, name: str, point: Point) -> None:
+        """
+        Moves a player, changing its cell only if it crossed a border.
+        """
+        old = self.cell(self.positions[name])
+        new = self.cell(point)
+        self.positions[name] = point
+        if old != new:
+            self._discard(old, name)
+            self._add(new, name)
+
+    def remove(self, name: str) -> None:
+        """
+        Removes a player from the grid.
+        """
+        self._discard(self.cell(self.positions.pop(name)), name)
+
+    def _add(self, cell: tuple[int, int, int], name: str) -> None:
+        """
+        Adds a player to a cell, growing bounds to include it.
+        """
+        self.cells.setdefault(cell, set()).add(name)
+        if self.bounds is None:
+            self.bounds = (cell, cell)
+        else:
+            low, high = self.bounds
+            self.bounds = (tuple(map(min, low, cell)),
+                           tuple(map(max, high, cell)))
+
+    def _discard(self, cell: tuple[int, int, int], name: str) -> None:
+        """
+        Removes a player from a cell, dropping the cell once empty.
+        """
+        members = self.cells[cell]
+        members.discard(name)
+        if not members:
+            del self.cells[cell]
+            if not self.cells:
+                self.bounds = None
+
+    def _ring(self, center: tuple[int, int, int], ring: int
+              ) -> list[tuple[int, int, int]]:
+        """
+        Returns the occupied cells at Chebyshev distance ring from center.
+
+        Every cell of the ring is probed, so callers switch to a scan
+        of all players once rings grow too large (see _ring_too_large).
+        """
+        cx, cy, cz = center
+        span = range(-ring, ring + 1)
+        faces = (-ring, ring) if ring else (0,)
+        found = []
+        for dx, dy in product(span, span):
+            # Inside the x/y border only the two z faces are on the ring
+            on_border = max(abs(dx), abs(dy)) == ring
+            for dz in span if on_border else faces:
+                cell = (cx + dx, cy + dy, cz + dz)
+                if cell in self.cells:
+                    found.append(cell)
+        return found
+
+    def _ring_too_large(self, ring: int) -> bool:
+        """
+        Returns whether probing the cells up to ring would cost more
+        than scanning every player.
+        """
+        return (2 * ring + 1) ** 3 > 2 * len(self.positions)
+
+    def within(self, point: Point, radius: float
+               ) -> list[tuple[str, float]]:
+        """
+        Returns the (name, distance) of every player within radius of a
+        point, closest first.
+        """
+        center = self.cell(point)
+        reach = math.ceil(radius / self.cell_size)
+        if self._ring_too_large(reach):
+            names: Iterable[str] = self.positions
+        else:
+            names = [name for ring in range(reach + 1)
+                     for cell in self._ring(center, ring)
+                     for name in self.cells[cell]]
+        found = []
+        for name in names:
+            distance = math.dist(point, self.positions[name])
+            if distance <= radius:
+                found.append((name, distance))
+        return sorted(found, key=lambda item: item[1])
+
+    def nearest(self, point: Point, k: int = 1) -> list[tuple[str, float]]:
+        """
+        Returns the (name, distance) of the k players closest to a point,
+        closest first.
+
+        Rings of cells are visited outwards, starting from the first one
+        that reaches bounds, until k players are found closer than any
+        unvisited cell can be. Once probing rings would cost more than a
+        pass over every player, as for a point far from every player,
+        all distances are computed in that single pass.
+        """
+        if k <= 0 or self.bounds is None:
+            return []
+        center = self.cell(point)
+        found: list[tuple[str, float]] = []
+        seen = 0
+        low, high = self.bounds
+        ring = max(max(lo - c, 0, c - hi)
+                   for c, lo, hi in zip(center, low, high))
+        while seen < len(self.positions):
+            if self._ring_too_large(ring):
+                closest = nsmallest(
+                    k, self.positions.items(),
+                    key=lambda item: math.dist(point, item[1])
+                )
+                return [(name, math.dist(point, position))
+                        for name, position in closest]
+            for cell in self._ring(center, ring):
+                for name in self.cells[cell]:
+                    found.append(
+                        (name, math.dist(point, self.positions[name]))
+                    )
+                    seen += 1
+            if len(found) >= k:
+                found = nsmallest(k, found, key=lambda item: item[1])
+                if found[-1][1] <= ring * self.cell_size:
+                    break
+            ring += 1
+        return nsmallest(k, found, key=lambda item: item[1])
+
+
 def main() -> None:
     """
     Orchestrates the processing and displaying of coordinates.
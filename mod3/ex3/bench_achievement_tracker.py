@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+
+import random
+import sys
+import time
+from typing import Any, Callable
+
+from ft_achievement_tracker import AchievementRegistry
+
+
+def timed(label: str, func: Callable[[], Any]) -> None:
+    """
+    Runs func once and displays how long it took.
+    """
+    start = time.perf_counter()
+    func()
+    print(f"{label:<28} {time.perf_counter() - start:.3f} s")
+
+
+def rare_sets(sets: list[set[str]]) -> set[str]:
+    """
+    Returns the achievements found in exactly one of the sets.
+    """
+    once: set[str] = set()
+    twice: set[str] = set()
+    for achievements in sets:
+        twice |= once & achievements
+        once |= achievements
+    return once - twice
+
+
+def bench_achievements(n_players: int) -> None:
+    """
+    Compares set-based and bitmask-based achievement analytics.
+    """
+    print(f"=== Achievements ({n_players} players) ===")
+    rng = random.Random(42)
+    names = [f"achievement_{i}" for i in range(64)]
+    sets = [set(rng.sample(names, rng.randrange(1, 16)))
+            for _ in range(n_players)]
+    registry = AchievementRegistry()
+    for i, achievements in enumerate(sets):
+        registry.add_player(f"player_{i}", achievements)
+    pairs = list(zip(sets, sets[1:]))
+    masks = list(registry.players.values())
+    mask_pairs = list(zip(masks, masks[1:]))
+
+    timed("sets: union", lambda: set().union(*sets))
+    timed("bitmask: union", registry.union)
+    timed("sets: intersection", lambda: set.intersection(*sets))
+    timed("bitmask: intersection", registry.intersection)
+    timed("sets: rare", lambda: rare_sets(sets))
+    timed("bitmask: rare", registry.rare)
+    timed("sets: pairwise common", lambda: [a & b for a, b in pairs])
+    timed("bitmask: pairwise common",
+          lambda: [a & b for a, b in mask_pairs])
+
+
+if __name__ == "__main__":
+    bench_achievements(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
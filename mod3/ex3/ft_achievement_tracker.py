@@ -1,5 +1,157 @@
 #!/usr/bin/env python3
 
+from functools import reduce
+from operator import and_, or_
+from typing import Iterable
+
+
+class AchievementRegistry:
+    """
+    Maps achievement names to bit positions and stores each player's
+    achievements as an int bitmask, so set operations across players
+    are bitwise operations on ints.
+
+    Also indexes, per achievement, its holders, and groups achievements
+    by holder count, so rarity queries need no scan over players.
+    """
+
+    def __init__(self) -> None:
+        """
+        Creates an empty registry.
+        """
+        self.bits: dict[str, int] = {}
+        self.achievements: list[str] = []
+        self.players: dict[str, int] = {}
+        self.holders: dict[str, set[str]] = {}
+        self.by_count: dict[int, set[str]] = {}
+
+    def bit(self, achievement: str) -> int:
+        """
+        Returns the mask of an achievement, registering it if new.
+        """
+        if achievement not in self.bits:
+            self.bits[achievement] = 1 << len(self.achievements)
+            self.achievements.append(achievement)
+            self.holders[achievement] = set()
+            self.by_count.setdefault(0, set()).add(achievement)
+        return self.bits[achievement]
+
+    def mask(self, achievements: Iterable[str]) -> int:
+        """
+        Returns the mask holding every given achievement.
+        """
+        return reduce(or_, map(self.bit, achievements), 0)
+
+    def names(self, mask: int) -> set[str]:
+        """
+        Returns the achievement names set in a mask.
+        """
+        names = set()
+        while mask:
+            low = mask & -mask
+            names.add(self.achievements[low.bit_length() - 1])
+            mask ^= low
+        return names
+
+    def unlock(self, player: str, achievement: str) -> None:
+        """
+        Grants an achievement to a player.
+        """
+        mask = self.bit(achievement)
+        held = self.players.setdefault(player, 0)
+        if held & mask:
+            return
+        self.players[player] = held | mask
+        holders = self.holders[achievement]
+        self._move(achievement, len(holders), len(holders) + 1)
+        holders.add(player)
+
+    def add_player(self, player: str, achievements: Iterable[str]) -> None:
+        """
+        Grants several achievements to a player.
+        """
+        self.players.setdefault(player, 0)
+        for achievement in achievements:
+            self.unlock(player, achievement)
+
+    def _move(self, achievement: str, old: int, new: int) -> None:
+        """
+        Moves an achievement from one holder count group to another.
+        """
+        group = self.by_count[old]
+        group.discard(achievement)
+        if not group:
+            del self.by_count[old]
+        self.by_count.setdefault(new, set()).add(achievement)
+
+    def held_by(self, k: int) -> set[str]:
+        """
+        Returns the achievements held by exactly k players.
+        """
+        return set(self.by_count.get(k, ()))
+
+    def common_to_all(self) -> set[str]:
+        """
+        Returns the achievements held by every player.
+        """
+        if not self.players:
+            return set()
+        return self.held_by(len(self.players))
+
+    def rarer_than(self, percent: float) -> set[str]:
+        """
+        Returns the achievements held by fewer than percent % of the
+        players (unheld achievements included).
+        """
+        limit = percent * len(self.players) / 100
+        rare: set[str] = set()
+        for count, achievements in self.by_count.items():
+            if count < limit:
+                rare |= achievements
+        return rare
+
+    def union(self, players: Iterable[str] | None = None) -> int:
+        """
+        Returns the achievements held by any of the players (default:
+        every player).
+        """
+        return reduce(or_, self._masks(players), 0)
+
+    def intersection(self, players: Iterable[str] | None = None) -> int:
+        """
+        Returns the achievements held by all of the players (default:
+        every player).
+        """
+        masks = list(self._masks(players))
+        return reduce(and_, masks) if masks else 0
+
+    def difference(self, player: str, others: Iterable[str]) -> int:
+        """
+        Returns the achievements of player held by none of the others.
+        """
+        return self.players.get(player, 0) & ~self.union(others)
+
+    def rare(self, players: Iterable[str] | None = None) -> int:
+        """
+        Returns the achievements held by exactly one of the players
+        (default: every player).
+        """
+        once = 0
+        twice = 0
+        for mask in self._masks(players):
+            twice |= once & mask
+            once |= mask
+        return once & ~twice
+
+    def _masks(self, players: Iterable[str] | None) -> Iterable[int]:
+        """
+        Returns the masks of the given players, or of every player.
+        """
+        if players is None:
+            return self.players.values()
+        return (self.players.get(player, 0) for player in players)
+
+
 def main() -> None:
     """
     Orchestrates the achievement tracking.
@@ -37,29 +189,30 @@ def main() -> None:
 
     print("\n=== Achievement Analytics ===")
 
-    all_achievements = alice.union(bob, charlie)
+    registry = AchievementRegistry()
+    registry.add_player("alice", alice)
+    registry.add_player("bob", bob)
+    registry.add_player("charlie", charlie)
+
+    all_achievements = registry.names(registry.union())
 
     print(f"All unique achievements: {all_achievements}")
     print(f"Total unique achievements: {len(all_achievements)}")
 
-    common_achievements = alice.intersection(bob, charlie)
+    common_achievements = registry.common_to_all()
 
     print(f"\nCommon to all players: {common_achievements}")
 
-    alice_unique = alice.difference(bob, charlie)
-    bob_unique = bob.difference(alice, charlie)
-    charlie_unique = charlie.difference(bob, alice)
-
-    rare_achievements = alice_unique.union(bob_unique, charlie_unique)
+    rare_achievements = registry.held_by(1)
 
     print(f"Rare achievements (1 player): {rare_achievements}")
 
-    common_alice_bob = alice.intersection(bob)
+    common_alice_bob = registry.names(registry.intersection(["alice", "bob"]))
 
     print(f"\nAlice vs Bob common: {common_alice_bob}")
 
-    new_alice_unique = alice.difference(bob)
-    new_bob_unique = bob.difference(alice)
+    new_alice_unique = registry.names(registry.difference("alice", ["bob"]))
+    new_bob_unique = registry.names(registry.difference("bob", ["alice"]))
 
     print(f"Alice unique: {new_alice_unique}")
     print(f"Bob unique: {new_bob_unique}")
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+
+import random
+import sys
+import time
+import tracemalloc
+from threading import Thread
+from typing import Any, Callable
+
+from columnar_inventory import ColumnarInventory
+from ft_inventory_system import Inventory, transfer_batch, transfer_item
+
+
+def make_players(n_players: int, n_items: int) -> list[Inventory]:
+    """
+    Creates n_players inventories holding n_items kinds of items each.
+    """
+    return [
+        Inventory({
+            f"item_{i}": {
+                "type": f"type_{i % 5}",
+                "rarity": ["common", "uncommon", "rare"][i % 3],
+                "qty": 1000,
+                "price": i + 1
+            }
+            for i in range(n_items)
+        })
+        for _ in range(n_players)
+    ]
+
+
+def bench_transfers(n_transfers: int) -> None:
+    """
+    Times concurrent batch transfers among few players (high contention).
+
+    Displays transfers/sec per thread count and batch size, and checks
+    that no item was created or lost.
+    """
+    print(f"=== transfer_batch ({n_transfers} transfers per run) ===")
+    for n_threads in (1, 4, 16):
+        for batch_size in (1, 16):
+            players = make_players(8, 20)
+            total = sum(player.total_qty for player in players)
+            per_thread = n_transfers // n_threads // batch_size
+
+            def trade(seed: int) -> None:
+                rng = random.Random(seed)
+                for _ in range(per_thread):
+                    batch = []
+                    for _ in range(batch_size):
+                        source, target = rng.sample(players, 2)
+                        item = f"item_{rng.randrange(20)}"
+                        batch.append((source, target, item, 1))
+                    try:
+                        transfer_batch(batch)
+                    except ValueError:
+                        pass
+
+            threads = [Thread(target=trade, args=(i,))
+                       for i in range(n_threads)]
+            start = time.perf_counter()
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            elapsed = time.perf_counter() - start
+            assert sum(player.total_qty for player in players) == total
+            done = per_thread * n_threads * batch_size
+            print(
+                f"{n_threads:>2} threads, batch {batch_size:>2}:",
+                f"{done / elapsed:,.0f} transfers/s"
+            )
+
+
+def check_reentrant_watcher() -> None:
+    """
+    Checks that a watcher can start a transfer on an inventory of the
+    batch that notified it, in a thread so a deadlock fails the check
+    instead of hanging.
+    """
+    source, target = make_players(2, 1)
+    returned: list[int] = []
+
+    def give_back(inventory: Inventory, item_name: str) -> None:
+        if not returned:
+            returned.append(1)
+            transfer_item(inventory, source, item_name, 1)
+
+    target.watchers.append(give_back)
+    thread = Thread(target=transfer_item, args=(source, target, "item_0", 1),
+                    daemon=True)
+    thread.start()
+    thread.join(timeout=5)
+    assert not thread.is_alive(), "watcher deadlocked on inventory locks"
+    assert source["item_0"]["qty"] == target["item_0"]["qty"] == 1000
+    print("Reentrant watcher: OK")
+
+
+def traced(build: Callable[[], Any]) -> tuple[Any, int]:
+    """
+    Runs build() under tracemalloc.
+
+    Returns its result and the memory it still holds afterwards.
+    """
+    tracemalloc.start()
+    result = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, size
+
+
+def bench_columnar(n_items: int) -> None:
+    """
+    Compares dict-per-item storage with ColumnarInventory.
+
+    Displays memory held by each representation (item names excluded,
+    both share them) and the time to compute value, quantity and
+    per-category totals.
+    """
+    print(f"\n=== Columnar storage ({n_items} items) ===")
+    names = [f"item_{i}" for i in range(n_items)]
+    types = ["weapon", "armor", "consumable", "accessory"]
+    rarities = ["common", "uncommon", "rare"]
+
+    def build_dicts() -> dict[str, dict[str, str | int]]:
+        return {
+            name: {
+                "type": types[i % 4],
+                "rarity": rarities[i % 3],
+                "qty": i % 100,
+                "price": i % 1000
+            }
+            for i, name in enumerate(names)
+        }
+
+    def build_columns() -> ColumnarInventory:
+        inventory = ColumnarInventory()
+        for i, name in enumerate(names):
+            inventory.add(name, types[i % 4], rarities[i % 3], i % 100,
+                          i % 1000)
+        return inventory
+
+    def dict_totals(items: dict[str, dict[str, str | int]]) -> None:
+        value = 0
+        qty = 0
+        categories: dict[str, int] = {}
+        for data in items.values():
+            value += data["qty"] * data["price"]
+            qty += data["qty"]
+            categories[data["type"]] = (
+                categories.get(data["type"], 0) + data["qty"]
+            )
+
+    def column_totals(inventory: ColumnarInventory) -> None:
+        inventory.total_value
+        inventory.total_qty
+        inventory.category_qty
+
+    for name, build, totals in [("dicts", build_dicts, dict_totals),
+                                ("columnar", build_columns, column_totals)]:
+        inventory, size = traced(build)
+        start = time.perf_counter()
+        totals(inventory)
+        elapsed = time.perf_counter() - start
+        print(
+            f"{name:<9} {size / 2 ** 20:8.1f} MiB,",
+            f"totals in {elapsed:.3f} s"
+        )
+        del inventory
+
+
+if __name__ == "__main__":
+    check_reentrant_watcher()
+    bench_transfers(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
+    bench_columnar(1_000_000)
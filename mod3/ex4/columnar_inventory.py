@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+
+from array import array
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class ColumnarInventory:
+    """
+    Inventory stored as parallel columns instead of one dict per item.
+
+    Names are a list, qty and price are int64 arrays, and type and
+    rarity are categorical codes into small lists of distinct values.
+    Codes are 32-bit for types and 16-bit for rarities, so at most
+    2 ** 32 types and 65536 rarities can be stored (OverflowError past
+    that). Totals are computed over whole columns, with NumPy when
+    installed and the result cannot overflow int64, and with Python
+    ints otherwise, so they are always exact.
+    """
+
+    def __init__(self) -> None:
+        """
+        Creates an empty inventory.
+        """
+        self.names: list[str] = []
+        self.rows: dict[str, int] = {}
+        self.type_codes = array("I")
+        self.rarity_codes = array("H")
+        self.qty = array("q")
+        self.price = array("q")
+        self.types: list[str] = []
+        self.rarities: list[str] = []
+        self._type_index: dict[str, int] = {}
+        self._rarity_index: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        """
+        Returns the number of distinct items.
+        """
+        return len(self.names)
+
+    def __contains__(self, name: str) -> bool:
+        """
+        Returns whether the item was ever added to the inventory.
+        """
+        return name in self.rows
+
+    def __getitem__(self, name: str) -> dict[str, str | int]:
+        """
+        Returns the data of an item as a new dict.
+        """
+        row = self.rows[name]
+        return {
+            "type": self.types[self.type_codes[row]],
+            "rarity": self.rarities[self.rarity_codes[row]],
+            "qty": self.qty[row],
+            "price": self.price[row]
+        }
+
+    def add(self, name: str, item_type: str, rarity: str, qty: int,
+            price: int) -> None:
+        """
+        Adds qty units of an item, registering it if it is new.
+        """
+        row = self.rows.get(name)
+        if row is not None:
+            self.qty[row] += qty
+            return
+        if item_type not in self._type_index:
+            self._type_index[item_type] = len(self.types)
+            self.types.append(item_type)
+        if rarity not in self._rarity_index:
+            self._rarity_index[rarity] = len(self.rarities)
+            self.rarities.append(rarity)
+        self.rows[name] = len(self.names)
+        self.names.append(name)
+        self.type_codes.append(self._type_index[item_type])
+        self.rarity_codes.append(self._rarity_index[rarity])
+        self.qty.append(qty)
+        self.price.append(price)
+
+    def remove(self, name: str, qty: int) -> None:
+        """
+        Removes qty units of an item.
+
+        Raises ValueError if the item is missing or not held in
+        sufficient quantity.
+        """
+        row = self.rows.get(name)
+        if row is None or self.qty[row] < qty:
+            raise ValueError(f"not enough {name} to remove {qty}")
+        self.qty[row] -= qty
+
+    def _int64_columns(self, *columns: array) -> list | None:
+        """
+        Returns the columns as NumPy arrays when NumPy is installed and
+        a sum of their element-wise product cannot overflow int64.
+
+        Returns None otherwise.
+        """
+        if np is None or not self.names:
+            return None
+        arrays = [np.frombuffer(column, dtype=np.int64) for column in columns]
+        bound = len(self.names)
+        for values in arrays:
+            bound *= max(-int(values.min()), int(values.max()))
+        return arrays if bound < 2 ** 63 else None
+
+    @property
+    def total_value(self) -> int:
+        """
+        Total value of the inventory (qty * price over all items).
+        """
+        arrays = self._int64_columns(self.qty, self.price)
+        if arrays is not None:
+            return int(np.dot(*arrays))
+        return sum(map(int.__mul__, self.qty, self.price))
+
+    @property
+    def total_qty(self) -> int:
+        """
+        Total quantity of items in the inventory.
+        """
+        arrays = self._int64_columns(self.qty)
+        if arrays is not None:
+            return int(arrays[0].sum())
+        return sum(self.qty)
+
+    @property
+    def category_qty(self) -> dict[str, int]:
+        """
+        Quantity held per item type.
+        """
+        arrays = self._int64_columns(self.qty)
+        if arrays is not None:
+            totals = np.zeros(len(self.types), dtype=np.int64)
+            np.add.at(totals, np.frombuffer(self.type_codes, dtype=np.uint32),
+                      arrays[0])
+            return dict(zip(self.types, map(int, totals)))
+        per_code = [0] * len(self.types)
+        for code, qty in zip(self.type_codes, self.qty):
+            per_code[code] += qty
+        return dict(zip(self.types, per_code))
+
+    def items_of_rarity(self, rarity: str) -> list[str]:
+        """
+        Returns the names of the items with the given rarity.
+        """
+        code = self._rarity_index.get(rarity)
+        return [name for name, item_code in zip(self.names, self.rarity_codes)
+                if item_code == code]
+
+    def items_of_type(self, item_type: str) -> list[str]:
+        """
+        Returns the names of the items with the given type.
+        """
+        code = self._type_index.get(item_type)
+        return [name for name, item_code in zip(self.names, self.type_codes)
+                if item_code == code]
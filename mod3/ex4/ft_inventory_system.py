@@ -1,25 +1,129 @@
 #!/usr/bin/env python3
 
-def print_inventory(inventory: dict[str, dict[str, str | int]]) -> None:
+from contextlib import ExitStack
+from itertools import count
+from threading import Lock
+from typing import Callable, Iterable
+
+from leaderboard import Leaderboard
+
+Item = dict[str, str | int]
+Transfer = tuple["Inventory", "Inventory", str, int]
+
+
+class Inventory:
     """
-    Calculates total inventory value and item count.
-    Constructs category str.
+    Player inventory indexed by rarity and type, keeping its value,
+    quantity and per-category quantity totals up to date on every change.
 
-    Displays inventory value, item count and categories.
+    Each inventory has its own lock; uid gives the order in which
+    several inventories must be locked together. Watchers are called
+    with the inventory and item name after every quantity change.
     """
-    total_value = 0
-    total_count = 0
-    total_categories = {}
 
-    for name, data in inventory.items():
-        total_value += data["qty"] * data["price"]
-        total_count += data["qty"]
+    _uids = count()
+
+    def __init__(self, items: dict[str, Item] | None = None) -> None:
+        """
+        Creates the inventory, adding the given items.
+        """
+        self.uid = next(Inventory._uids)
+        self.lock = Lock()
+        self.watchers: list[Callable[[Inventory, str], None]] = []
+        self.items: dict[str, Item] = {}
+        self.by_rarity: dict[str, dict[str, None]] = {}
+        self.by_type: dict[str, dict[str, None]] = {}
+        self.total_value = 0
+        self.total_qty = 0
+        self.category_qty: dict[str, int] = {}
+        for name, data in (items or {}).items():
+            self.add(name, data["type"], data["rarity"], data["qty"],
+                     data["price"])
+
+    def __contains__(self, name: str) -> bool:
+        """
+        Returns whether the item was ever added to the inventory.
+        """
+        return name in self.items
+
+    def __getitem__(self, name: str) -> Item:
+        """
+        Returns the data of an item.
+        """
+        return self.items[name]
+
+    def items_of_rarity(self, rarity: str) -> list[str]:
+        """
+        Returns the names of the items with the given rarity.
+        """
+        return list(self.by_rarity.get(rarity, {}))
+
+    def items_of_type(self, item_type: str) -> list[str]:
+        """
+        Returns the names of the items with the given type.
+        """
+        return list(self.by_type.get(item_type, {}))
+
+    def add(self, name: str, item_type: str, rarity: str, qty: int,
+            price: int, notify: bool = True) -> None:
+        """
+        Adds qty units of an item, registering it if it is new.
+
+        Without notify, watchers are not called.
+        """
+        if name not in self.items:
+            self.items[name] = {
+                "type": item_type,
+                "rarity": rarity,
+                "qty": 0,
+                "price": price
+            }
+            self.by_rarity.setdefault(rarity, {})[name] = None
+            self.by_type.setdefault(item_type, {})[name] = None
+        self._update(name, qty, notify)
+
+    def remove(self, name: str, qty: int, notify: bool = True) -> None:
+        """
+        Removes qty units of an item.
+
+        Without notify, watchers are not called.
+
+        Raises ValueError if the item is missing or not held in
+        sufficient quantity.
+        """
+        if name not in self.items or self.items[name]["qty"] < qty:
+            raise ValueError(f"not enough {name} to remove {qty}")
+        self._update(name, -qty, notify)
+
+    def notify(self, name: str) -> None:
+        """
+        Calls every watcher with the inventory and item name.
+        """
+        for watcher in self.watchers:
+            watcher(self, name)
+
+    def _update(self, name: str, qty: int, notify: bool) -> None:
+        """
+        Changes the quantity of a registered item and every total.
+        """
+        data = self.items[name]
+        data["qty"] += qty
+        self.total_qty += qty
+        self.total_value += qty * data["price"]
+        self.category_qty[data["type"]] = (
+            self.category_qty.get(data["type"], 0) + qty
+        )
+        if notify:
+            self.notify(name)
+
 
-        if data["type"] in total_categories:
-            total_categories[data["type"]] += data["qty"]
-        else:
-            total_categories[data["type"]] = data["qty"]
+def print_inventory(inventory: Inventory) -> None:
+    """
+    Constructs category str.
 
+    Displays inventory value, item count and categories.
+    """
+    for name, data in inventory.items.items():
         print(
             f"{name} ({data['type']}, {data['rarity']}):",
             f"{data['qty']}x @ {data['price']} gold each =",
@@ -28,114 +132,115 @@ def print_inventory(inventory: dict[str, dict[str, str | int]]) -> None:
 
     final_str = ""
     i = 0
-    for category, qty in total_categories.items():
+    for category, qty in inventory.category_qty.items():
         if i > 0:
             final_str += ", "
         final_str += f"{category} ({qty})"
         i += 1
 
-    print(f"\nInventory value: {total_value} gold")
-    print(f"Item count: {total_count} items")
+    print(f"\nInventory value: {inventory.total_value} gold")
+    print(f"Item count: {inventory.total_qty} items")
     print(f"Categories: {final_str}")
 
 
+def transfer_batch(transfers: Iterable[Transfer]) -> None:
+    """
+    Applies (source, target, item_name, quantity) transfers atomically:
+    either every transfer succeeds or no inventory is changed.
+
+    Locks every inventory involved in uid order, so concurrent batches
+    cannot deadlock. Items received earlier in the batch can be passed
+    on by later transfers. Watchers are only called once the whole
+    batch is applied and every lock released, once per changed item of
+    each inventory, so they may start transfers of their own.
+
+    Raises ValueError if a quantity is not positive or a source does
+    not hold enough of an item at its point in the batch.
+    """
+    transfers = list(transfers)
+    involved = {inv.uid: inv for src, dst, _, _ in transfers
+                for inv in (src, dst)}
+    changed: dict[tuple[int, str], Inventory] = {}
+    with ExitStack() as stack:
+        for uid in sorted(involved):
+            stack.enter_context(involved[uid].lock)
+        available: dict[tuple[int, str], int] = {}
+        for source, target, item_name, quantity in transfers:
+            if quantity <= 0:
+                raise ValueError(f"invalid quantity {quantity}")
+            key = (source.uid, item_name)
+            if key not in available and item_name in source:
+                available[key] = source[item_name]["qty"]
+            if available.get(key, 0) < quantity:
+                raise ValueError(
+                    f"not enough {item_name} to transfer {quantity}"
+                )
+            available[key] -= quantity
+            dest = (target.uid, item_name)
+            if dest not in available:
+                available[dest] = (
+                    target[item_name]["qty"] if item_name in target else 0
+                )
+            available[dest] += quantity
+        for source, target, item_name, quantity in transfers:
+            data = source[item_name]
+            source.remove(item_name, quantity, notify=False)
+            target.add(item_name, data["type"], data["rarity"], quantity,
+                       data["price"], notify=False)
+            changed[source.uid, item_name] = source
+            changed[target.uid, item_name] = target
+    for (_, item_name), inventory in changed.items():
+        inventory.notify(item_name)
+
+
 def transfer_item(
-        source: dict[str, dict[str, str | int]],
-        target: dict[str, dict[str, str | int]],
+        source: Inventory,
+        target: Inventory,
         item_name: str,
         quantity: int) -> None:
     """
     Transfers item from source to target inventory.
+
+    Raises ValueError if source does not hold enough of the item.
     """
-    if item_name in source:
-        if source[item_name]["qty"] >= quantity:
-            if item_name in target:
-                target[item_name]["qty"] += quantity
-            else:
-                target[item_name] = {
-                    "type": source[item_name]["type"],
-                    "rarity": source[item_name]["rarity"],
-                    "qty": quantity,
-                    "price": source[item_name]["price"],
-                }
-            source[item_name]["qty"] -= quantity
+    transfer_batch([(source, target, item_name, quantity)])
 
 
-def calc_value(inventory: dict[str, dict[str, str | int]]) -> int:
+def calc_value(inventory: Inventory) -> int:
     """
-    Calculates inventory value.
+    Retrieves inventory value.
 
     Returns total value.
     """
-    total_value = 0
-    for data in inventory.values():
-        total_value += data["qty"] * data["price"]
-    return total_value
+    return inventory.total_value
 
 
-def calc_qty(inventory: dict[str, dict[str, str | int]]) -> int:
+def calc_qty(inventory: Inventory) -> int:
     """
-    Calculates quantity of items in inventory.
+    Retrieves quantity of items in inventory.
 
     Returns total quantity.
     """
-    total_qty = 0
-    for data in inventory.values():
-        total_qty += data["qty"]
-    return total_qty
+    return inventory.total_qty
 
 
-def get_rare_items(inventory: dict[str, dict[str, str | int]]) -> list[str]:
+def get_rare_items(inventory: Inventory) -> list[str]:
     """
     Retrieves rare items from inventory.
 
     Returns list with item names.
     """
-    rare_list = []
-    for name, data in inventory.items():
-        if data["rarity"] == "rare":
-            rare_list += [name]
-    return rare_list
+    return inventory.items_of_rarity("rare")
 
 
-def print_analytics(
-        alice_inventory: dict[str, dict[str, str | int]],
-        bob_inventory: dict[str, dict[str, str | int]]) -> None:
+def print_analytics(leaderboard: Leaderboard) -> None:
     """
-    Calculates and displays inventory analytics for Alice and Bob.
+    Displays the leaderboard's most valuable player, the player with
+    the most items and the rare items held.
     """
-    alice_gold = calc_value(alice_inventory)
-    bob_gold = calc_value(bob_inventory)
-
-    if alice_gold > bob_gold:
-        mvp = "Alice"
-        mvp_value = alice_gold
-    else:
-        mvp = "Bob"
-        mvp_value = bob_gold
-
-    alice_qty = calc_qty(alice_inventory)
-    bob_qty = calc_qty(bob_inventory)
-
-    if alice_qty > bob_qty:
-        most_items = "Alice"
-        most_items_qty = alice_qty
-    else:
-        most_items = "Bob"
-        most_items_qty = bob_qty
-
-    alice_rare = get_rare_items(alice_inventory)
-    bob_rare = get_rare_items(bob_inventory)
-
-    rare_items = alice_rare + bob_rare
-
-    rare_str = ""
-    i = 0
-    while i < len(rare_items):
-        rare_str += rare_items[i]
-        if i < len(rare_items) - 1:
-            rare_str += ", "
-        i += 1
+    mvp, mvp_value = leaderboard.top_by_value()[0]
+    most_items, most_items_qty = leaderboard.top_by_qty()[0]
+    rare_str = ", ".join(leaderboard.rare_item_names())
 
     print(f"Most valuable player: {mvp} ({mvp_value} gold)")
     print(f"Most items: {most_items} ({most_items_qty} items)")
@@ -149,7 +254,7 @@ def main() -> None:
     print("=== Player Inventory System ===\n")
 
     print("=== Alice's Inventory ===")
-    alice_inventory: dict[str, dict[str, str | int]] = {
+    alice_inventory = Inventory({
         "sword": {
             "type": "weapon",
             "rarity": "rare",
@@ -168,23 +273,29 @@ def main() -> None:
             "qty": 1,
             "price": 200
         }
-    }
+    })
 
     print_inventory(alice_inventory)
 
     print("\n=== Transaction: Alice gives Bob 2 potions ===")
-    bob_inventory: dict[str, dict[str, str | int]] = {
+    bob_inventory = Inventory({
         "magic_ring": {
             "type": "accessory",
             "rarity": "rare",
             "qty": 1,
             "price": 400
         }
-    }
+    })
 
-    transfer_item(alice_inventory, bob_inventory, "potion", 2)
+    leaderboard = Leaderboard()
+    leaderboard.add_player("Alice", alice_inventory)
+    leaderboard.add_player("Bob", bob_inventory)
 
-    print("Transaction successful!")
+    try:
+        transfer_item(alice_inventory, bob_inventory, "potion", 2)
+        print("Transaction successful!")
+    except ValueError as e:
+        print(f"Transaction failed: {e}")
 
     print("\n=== Updated Inventories ===")
     print(f"Alice potions: {alice_inventory['potion']['qty']}")
@@ -192,7 +303,7 @@ def main() -> None:
 
     print("\n=== Inventory Analytics ===")
 
-    print_analytics(alice_inventory, bob_inventory)
+    print_analytics(leaderboard)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+
+from heapq import heapify, heappop, heappush
+from threading import Lock
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ft_inventory_system import Inventory
+
+
+class Leaderboard:
+    """
+    Ranks players by inventory value and quantity, and indexes which
+    players hold rare items.
+
+    Rankings are max-heaps updated whenever a tracked inventory changes.
+    Outdated heap entries are skipped when read rather than removed.
+    On equal totals, the player added last ranks first.
+    """
+
+    def __init__(self, rarity: str = "rare") -> None:
+        """
+        Creates an empty leaderboard indexing items of the given rarity.
+        """
+        self.rarity = rarity
+        self.names: dict[int, str] = {}
+        self.order: dict[str, int] = {}
+        self.values: dict[str, int] = {}
+        self.qtys: dict[str, int] = {}
+        self.value_heap: list[tuple[int, int, str]] = []
+        self.qty_heap: list[tuple[int, int, str]] = []
+        self.rare_items: dict[str, dict[str, None]] = {}
+        self.lock = Lock()
+
+    def add_player(self, name: str, inventory: "Inventory") -> None:
+        """
+        Starts tracking a player's inventory.
+        """
+        with self.lock:
+            self.names[inventory.uid] = name
+            self.order.setdefault(name, len(self.order))
+            for item_name in inventory.items_of_rarity(self.rarity):
+                self._index_item(name, inventory, item_name)
+            self._rank(name, inventory)
+        inventory.watchers.append(self.on_change)
+
+    def on_change(self, inventory: "Inventory", item_name: str) -> None:
+        """
+        Updates rankings and the rare item index after an item changed.
+        """
+        name = self.names[inventory.uid]
+        with self.lock:
+            if inventory[item_name]["rarity"] == self.rarity:
+                self._index_item(name, inventory, item_name)
+            self._rank(name, inventory)
+
+    def _index_item(self, name: str, inventory: "Inventory",
+                    item_name: str) -> None:
+        """
+        Adds or removes the player as a holder of a rare item.
+        """
+        holders = self.rare_items.setdefault(item_name, {})
+        if inventory[item_name]["qty"] > 0:
+            holders[name] = None
+        else:
+            holders.pop(name, None)
+            if not holders:
+                del self.rare_items[item_name]
+
+    def _rank(self, name: str, inventory: "Inventory") -> None:
+        """
+        Records the player's current value and quantity in the heaps.
+        """
+        for heap, current, total in (
+                (self.value_heap, self.values, inventory.total_value),
+                (self.qty_heap, self.qtys, inventory.total_qty)):
+            if current.get(name) != total:
+                current[name] = total
+                heappush(heap, (-total, -self.order[name], name))
+                if len(heap) > 2 * len(current) + 64:
+                    heap[:] = [(-score, -self.order[player], player)
+                               for player, score in current.items()]
+                    heapify(heap)
+
+    def _top(self, heap: list[tuple[int, int, str]],
+             current: dict[str, int], k: int) -> list[tuple[str, int]]:
+        """
+        Returns the k best (player, score) pairs of a heap, dropping
+        outdated entries met on the way.
+        """
+        with self.lock:
+            top: list[tuple[str, int]] = []
+            kept: list[tuple[int, int, str]] = []
+            while heap and len(top) < k:
+                entry = heappop(heap)
+                score, _, name = entry
+                if current[name] == -score and (name, -score) not in top:
+                    top.append((name, -score))
+                    kept.append(entry)
+            for entry in kept:
+                heappush(heap, entry)
+            return top
+
+    def top_by_value(self, k: int = 1) -> list[tuple[str, int]]:
+        """
+        Returns the k players with the most valuable inventories.
+        """
+        return self._top(self.value_heap, self.values, k)
+
+    def top_by_qty(self, k: int = 1) -> list[tuple[str, int]]:
+        """
+        Returns the k players holding the most items.
+        """
+        return self._top(self.qty_heap, self.qtys, k)
+
+    def rare_item_names(self) -> list[str]:
+        """
+        Returns the rare items held by at least one player.
+        """
+        with self.lock:
+            return list(self.rare_items)
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+
+import sys
+import time
+
+from ft_data_stream import (
+    analyze_events, analyze_parallel, fib, fibonnaci_gen, measure,
+    parse_event, prime_gen, stream_events
+)
+
+
+def bench_events(n_events: int) -> None:
+    """
+    Times event analytics on string events versus structured records.
+
+    Displays events/sec for each mode.
+    """
+    print(f"=== Event analytics ({n_events} events) ===")
+    modes = [
+        ("string", lambda: map(parse_event, stream_events(n_events))),
+        ("structured", lambda: stream_events(n_events, structured=True))
+    ]
+    for name, make_events in modes:
+        start = time.perf_counter()
+        analyze_events(make_events())
+        elapsed = time.perf_counter() - start
+        rate = n_events / elapsed
+        print(f"{name:<12} {elapsed:.3f} s, {rate:,.0f} events/s")
+
+
+def bench_memory(n_events: int) -> None:
+    """
+    Compares streaming analytics with a list-materializing baseline.
+
+    Displays wall/CPU time from an untraced run and peak memory from
+    a traced one.
+    """
+    print(f"\n=== Streaming vs list ({n_events} events) ===")
+    modes = [
+        ("streaming", lambda: stream_events(n_events, structured=True)),
+        ("list", lambda: list(stream_events(n_events, structured=True)))
+    ]
+    for name, make_events in modes:
+        _, usage = measure(lambda: analyze_events(make_events()), False)
+        _, traced = measure(lambda: analyze_events(make_events()))
+        print(
+            f"{name:<12} {usage['wall']:.3f} s wall,",
+            f"{usage['cpu']:.3f} s CPU,",
+            f"{n_events / usage['wall']:,.0f} events/s,",
+            f"{traced['peak'] / 2 ** 20:.1f} MiB peak"
+        )
+
+
+def bench_shards(n_events: int) -> None:
+    """
+    Times the sharded analytics with an increasing number of workers.
+    """
+    print(f"\n=== Sharded analytics ({n_events} events) ===")
+    start = time.perf_counter()
+    expected = analyze_events(stream_events(n_events, structured=True))
+    base = time.perf_counter() - start
+    print(f"{'sequential':<12} {base:.3f} s")
+    for workers in (1, 2, 4, 8):
+        start = time.perf_counter()
+        assert analyze_parallel(n_events, workers) == expected
+        elapsed = time.perf_counter() - start
+        print(f"{workers:<2} workers   {elapsed:.3f} s, x{base / elapsed:.2f}")
+
+
+def bench_primes(n_primes: int) -> None:
+    """
+    Times generating the first n_primes primes.
+    """
+    print(f"\n=== prime_gen (first {n_primes} primes) ===")
+    start = time.perf_counter()
+    last = 0
+    for last in prime_gen(n_primes):
+        pass
+    elapsed = time.perf_counter() - start
+    print(f"last prime {last}, {elapsed:.3f} s")
+
+
+def bench_fib(n: int) -> None:
+    """
+    Times fast-doubling fib(n) against iterating fibonnaci_gen to n.
+    """
+    print(f"\n=== fib({n}) ===")
+    start = time.perf_counter()
+    for value in fibonnaci_gen(n + 1):
+        pass
+    print(f"{'iterate':<14} {time.perf_counter() - start:.3f} s")
+    fib.cache_clear()
+    start = time.perf_counter()
+    fast = fib(n)
+    print(f"{'fast doubling':<14} {time.perf_counter() - start:.3f} s")
+    start = time.perf_counter()
+    fib(n)
+    print(f"{'cached':<14} {time.perf_counter() - start:.6f} s")
+    assert fast == value
+
+
+if __name__ == "__main__":
+    bench_events(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000)
+    bench_memory(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000)
+    bench_shards(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000)
+    bench_primes(1_000_000)
+    bench_fib(100_000)
+    bench_fib(1_000_000)
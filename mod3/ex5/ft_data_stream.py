@@ -1,45 +1,262 @@
 #!/usr/bin/env python3
 
-def stream_events(n_events: int):
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import compress
+from math import isqrt
+from os import cpu_count
+from time import perf_counter, process_time
+from typing import (
+    Any, Callable, Iterable, Iterator, Literal, NamedTuple, overload
+)
+import tracemalloc
+
+# Numbers sieved at a time by prime_gen
+PRIME_SEGMENT_SIZE = 1 << 16
+
+
+class Event(NamedTuple):
+    """
+    Compact record of a single game event.
+    """
+    event_id: int
+    player: str
+    level: int
+    action: str
+
+
+@overload
+def stream_events(n_events: int, structured: Literal[False] = False,
+                  start: int = 0) -> Iterator[str]:
+    ...
+
+
+@overload
+def stream_events(n_events: int, structured: Literal[True],
+                  start: int = 0) -> Iterator[Event]:
+    ...
+
+
+def stream_events(n_events: int, structured: bool = False,
+                  start: int = 0) -> Iterator[str | Event]:
     """
     Yields a str simulating an event, a total of n_events times.
+
+    With structured, yields Event records instead of strings.
+    With start, skips the events before it (used to produce shards).
     """
     names = ["alice", "bob", "charlie"]
     actions = ["killed monster", "found treasure", "leveled up"]
 
-    for i in range(n_events):
+    for i in range(start, n_events):
         name = names[i % len(names)]
         level = (i * 7) % 30 + 1
         action = actions[(i + 2) % len(actions)]
-        yield f"Event {i + 1}: Player {name} (level {level}) {action}"
+        if structured:
+            yield Event(i + 1, name, level, action)
+        else:
+            yield f"Event {i + 1}: Player {name} (level {level}) {action}"
+
+
+def parse_event(event: str) -> Event:
+    """
+    Parses an event str produced by stream_events into an Event.
+    """
+    head, _, tail = event.partition(": Player ")
+    name, _, tail = tail.partition(" (level ")
+    level, _, action = tail.partition(") ")
+    return Event(int(head[6:]), name, int(level), action)
+
+
+def format_event(event: Event) -> str:
+    """
+    Formats an Event the same way stream_events does.
+    """
+    return (
+        f"Event {event.event_id}: Player {event.player} "
+        f"(level {event.level}) {event.action}"
+    )
+
+
+def analyze_events(events: Iterable[Event], preview: int = 0
+                   ) -> dict[str, int]:
+    """
+    Counts total, high-level (10+), treasure, level-up and kill events.
+
+    Displays the first preview events followed by "...".
+    """
+    total = 0
+    high_level = 0
+    treasure = 0
+    level_up = 0
+    kill = 0
+    for event in events:
+        if total < preview:
+            print(format_event(event))
+        elif preview and total == preview + 1:
+            print("...")
+        action = event.action
+        if action == "leveled up":
+            level_up += 1
+        elif action == "found treasure":
+            treasure += 1
+        elif action == "killed monster":
+            kill += 1
+        if event.level >= 10:
+            high_level += 1
+        total += 1
+    return {
+        "total": total,
+        "high_level": high_level,
+        "treasure": treasure,
+        "level_up": level_up,
+        "kill": kill
+    }
+
+
+def measure(run: Callable[[], Any], trace_memory: bool = True
+            ) -> tuple[Any, dict[str, float]]:
+    """
+    Runs run() while measuring wall time, CPU time and the peak memory
+    allocated by Python (tracemalloc).
+
+    Tracing slows allocations down a lot, so without trace_memory the
+    peak is not measured and reported as 0.
+
+    Returns run()'s result and the measurements.
+    """
+    if trace_memory:
+        tracemalloc.start()
+    wall_start = perf_counter()
+    cpu_start = process_time()
+    result = run()
+    cpu = process_time() - cpu_start
+    wall = perf_counter() - wall_start
+    peak = 0
+    if trace_memory:
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return result, {"wall": wall, "cpu": cpu, "peak": peak}
 
 
-def fibonnaci_gen(n: int):
+def analyze_shard(bounds: tuple[int, int]) -> dict[str, int]:
     """
-    Yields the fibonnaci sequence of length n.
+    Produces and analyzes the events numbered from bounds[0] + 1 to
+    bounds[1].
     """
+    start, stop = bounds
+    return analyze_events(stream_events(stop, structured=True, start=start))
+
+
+def merge_stats(parts: Iterable[dict[str, int]]) -> dict[str, int]:
+    """
+    Merges partial event analytics by summing each count.
+    """
+    merged: dict[str, int] = {}
+    for part in parts:
+        for key, value in part.items():
+            merged[key] = merged.get(key, 0) + value
+    return merged
+
+
+def analyze_parallel(n_events: int, workers: int | None = None
+                     ) -> dict[str, int]:
+    """
+    Splits the events into one shard per worker process, each producing
+    and analyzing its own events, then merges the partial results.
+    """
+    if workers is None:
+        workers = cpu_count() or 1
+    step = -(-n_events // workers)
+    shards = [
+        (start, min(start + step, n_events))
+        for start in range(0, max(n_events, 1), step or 1)
+    ]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return merge_stats(executor.map(analyze_shard, shards))
+
+
+def fib_pair(n: int) -> tuple[int, int]:
+    """
+    Returns the pair (F(n), F(n + 1)) using fast doubling.
+
+    Runs in O(log n) big-int multiplications.
+    """
+    if n < 0:
+        raise ValueError("Fibonacci index must be non-negative")
     a, b = 0, 1
+    for bit in bin(n)[2:]:
+        c = a * (2 * b - a)
+        d = a * a + b * b
+        if bit == "1":
+            a, b = d, c + d
+        else:
+            a, b = c, d
+    return a, b
+
+
+@lru_cache(maxsize=128)
+def fib(n: int) -> int:
+    """
+    Returns the nth fibonnaci number, caching recent indices.
+    """
+    return fib_pair(n)[0]
+
+
+def fibonnaci_gen(n: int, start: int = 0):
+    """
+    Yields the fibonnaci sequence of length n, from index start.
+    """
+    a, b = fib_pair(start)
     for _ in range(n):
         yield a
         a, b = b, a + b
 
 
+def sieve_segment(low: int, high: int, base: list[int]) -> bytearray:
+    """
+    Sieves the range [low, high) with the given base primes.
+
+    Returns a bytearray flagging with 1 the numbers that are prime,
+    provided base holds every prime below sqrt(high).
+    """
+    sieve = bytearray(b"\x01") * (high - low)
+    for p in base:
+        if p * p >= high:
+            break
+        start = max(p * p, (low + p - 1) // p * p) - low
+        sieve[start::p] = bytes(len(range(start, high - low, p)))
+    return sieve
+
+
 def prime_gen(n: int):
     """
     Yields the prime number sequence of length n.
+
+    Uses a segmented Sieve of Eratosthenes, sieving the next segment
+    only once the previous one has been consumed.
     """
-    prime_count = 0
-    num = 2
-    while prime_count < n:
-        is_prime = True
-        for div in range(2, num):
-            if num % div == 0:
-                is_prime = False
-                break
-        if is_prime:
-            yield num
-            prime_count += 1
-        num += 1
+    if n <= 0:
+        return
+    base = [2, 3, 5, 7]
+    base_end = 11
+    low = 2
+    count = 0
+    while True:
+        high = low + PRIME_SEGMENT_SIZE
+        limit = isqrt(high - 1) + 1
+        while base_end < limit:
+            new_end = min(limit, base_end * base_end)
+            sieve = sieve_segment(base_end, new_end, base)
+            base.extend(compress(range(base_end, new_end), sieve))
+            base_end = new_end
+        for prime in compress(range(low, high),
+                              sieve_segment(low, high, base)):
+            yield prime
+            count += 1
+            if count == n:
+                return
+        low = high
 
 
 def print_demo() -> None:
@@ -68,47 +285,32 @@ def main() -> None:
     """
     Orchestrates the generation, analytics and display of events.
 
+    Times an untraced run and takes peak memory from a separate traced
+    one, as tracing would inflate the timings.
+
     Displays generator demo.
     """
     print("=== Game Data Stream Processor ===")
-    count_level = 0
-    count_treasure = 0
-    count_kill = 0
-    count_high_level = 0
-    i = 0
     n_events = 1000
     print(f"\nProcessing {n_events} game events...\n")
-    for event in stream_events(n_events):
-        if i < 3:
-            print(event)
-        if i == 4:
-            print("...")
-        if "leveled up" in event:
-            count_level += 1
-        elif "found treasure" in event:
-            count_treasure += 1
-        elif "killed monster" in event:
-            count_kill += 1
-        level_capture = ""
-        for j in range(len(event)):
-            if event[j] == "(":
-                k = j + 7
-                while event[k] != ")":
-                    level_capture += event[k]
-                    k += 1
-                break
-            j += 1
-        i += 1
-        if len(level_capture) >= 2:
-            count_high_level += 1
+    stats, usage = measure(
+        lambda: analyze_events(stream_events(n_events, structured=True), 3),
+        trace_memory=False
+    )
+    _, traced = measure(
+        lambda: analyze_events(stream_events(n_events, structured=True))
+    )
     print("\n=== Stream Analytics ===")
-    print(f"Total events processed: {i}")
-    print(f"High-level players (10+): {count_high_level}")
-    print(f"Treasure events: {count_treasure}")
-    print(f"Level-up events: {count_level}")
-
-    print("\nMemory usage: Constant (streaming)")
-    print("Processing time: 0.045 seconds")
+    print(f"Total events processed: {stats['total']}")
+    print(f"High-level players (10+): {stats['high_level']}")
+    print(f"Treasure events: {stats['treasure']}")
+    print(f"Level-up events: {stats['level_up']}")
+    print(f"\nMemory usage: {traced['peak'] / 1024:.1f} KB peak")
+    print(
+        f"Processing time: {usage['wall']:.3f} seconds",
+        f"(CPU {usage['cpu']:.3f} seconds)"
+    )
+    print(f"Throughput: {stats['total'] / usage['wall']:,.0f} events/sec")
 
     print("\n=== Generator Demonstration ===")
     print_demo()
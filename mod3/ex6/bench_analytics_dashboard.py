@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+
+import sys
+import time
+import tracemalloc
+from typing import Iterator
+
+from ft_analytics_dashboard import Row, summarize
+
+
+def generate_rows(n_players: int) -> Iterator[Row]:
+    """
+    Yields n_players synthetic (name, score, active) rows.
+    """
+    for i in range(n_players):
+        yield f"player_{i}", (i * 7919) % 4000, i % 3 != 0
+
+
+def bench_summarize(n_players: int) -> None:
+    """
+    Times the single-pass summary over generated rows.
+
+    Displays rows/sec, then peak traced memory on a smaller run.
+    """
+    print(f"=== summarize ({n_players} players) ===")
+    start = time.perf_counter()
+    summarize(generate_rows(n_players))
+    elapsed = time.perf_counter() - start
+    print(f"{elapsed:.3f} s, {n_players / elapsed:,.0f} rows/s")
+    sample = min(n_players, 1_000_000)
+    tracemalloc.start()
+    summarize(generate_rows(sample))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"peak memory over {sample} rows: {peak / 1024:.1f} KB")
+
+
+if __name__ == "__main__":
+    bench_summarize(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000)
@@ -1,10 +1,218 @@
 #!/usr/bin/env python3
 
+import csv
+import sys
+from heapq import heapify, heappop, heappush
+from typing import Any, Iterable, Iterator
+
+Row = tuple[str, int, bool]
+
+
+def read_rows(path: str) -> Iterator[Row]:
+    """
+    Yields (name, score, active) rows from a "name,score,active" CSV
+    file, one line at a time.
+
+    Blank lines and a header on the first non-blank row are skipped;
+    malformed rows are reported and skipped.
+    """
+    with open(path, newline="", encoding="utf-8") as file:
+        first = True
+        for line_no, row in enumerate(csv.reader(file), 1):
+            if not any(field.strip() for field in row):
+                continue
+            if first:
+                first = False
+                if row[0].strip().lower() == "name":
+                    continue
+            try:
+                name, score, active = row
+                points = int(score)
+            except ValueError:
+                print(f"Error: line {line_no} is not a valid row: {row}")
+                continue
+            yield name, points, active.strip().lower() in ("1", "true")
+
+
+def summarize(rows: Iterable[Row], threshold: int = 2000
+              ) -> dict[str, Any]:
+    """
+    Computes every dashboard metric in a single pass over the rows,
+    keeping only running totals in memory.
+
+    Returns totals, average, max and top scorer, active player count,
+    high scorer count and score category counts.
+    """
+    total_players = 0
+    total_score = 0
+    active_players = 0
+    high_scorers = 0
+    max_score = None
+    top_scorer = None
+    for name, score, active in rows:
+        total_players += 1
+        total_score += score
+        if active:
+            active_players += 1
+        if score > threshold:
+            high_scorers += 1
+        if max_score is None or score > max_score:
+            max_score = score
+            top_scorer = name
+    return {
+        "total_players": total_players,
+        "total_score": total_score,
+        "avg_score": total_score / total_players if total_players else 0,
+        "max_score": max_score,
+        "top_scorer": top_scorer,
+        "active_players": active_players,
+        "high_scorers": high_scorers,
+        "categories": {
+            "high": high_scorers,
+            "standard": total_players - high_scorers
+        }
+    }
+
+
+class Dashboard:
+    """
+    Live dashboard updated one score or activity change at a time.
+
+    Totals, counts and the high score set are kept up to date on every
+    update. The top scorer comes from a max-heap whose outdated entries
+    are dropped when they reach the top.
+    """
+
+    def __init__(self, threshold: int = 2000) -> None:
+        """
+        Creates an empty dashboard; scores above threshold are high.
+        """
+        self.threshold = threshold
+        self.scores: dict[str, int] = {}
+        self.active: dict[str, bool] = {}
+        self.order: dict[str, int] = {}
+        self.added = 0
+        self.total_score = 0
+        self.active_players = 0
+        self.high_scorers: set[str] = set()
+        self.heap: list[tuple[int, int, str]] = []
+
+    def ingest(self, rows: Iterable[Row]) -> None:
+        """
+        Applies a (name, score, active) row for each player.
+        """
+        for name, score, active in rows:
+            self.update_score(name, score)
+            self.set_active(name, active)
+
+    def update_score(self, name: str, score: int) -> None:
+        """
+        Sets a player's score, adding the player if new.
+        """
+        if name in self.scores:
+            self.total_score -= self.scores[name]
+        else:
+            self.order[name] = self.added
+            self.added += 1
+            self.active[name] = False
+        self.scores[name] = score
+        self.total_score += score
+        if score > self.threshold:
+            self.high_scorers.add(name)
+        else:
+            self.high_scorers.discard(name)
+        heappush(self.heap, (-score, self.order[name], name))
+        if len(self.heap) > 2 * len(self.scores) + 64:
+            self.heap = [(-points, self.order[player], player)
+                         for player, points in self.scores.items()]
+            heapify(self.heap)
+
+    def set_active(self, name: str, active: bool) -> None:
+        """
+        Marks a known player as active or inactive.
+        """
+        self.active_players += active - self.active[name]
+        self.active[name] = active
+
+    def remove_player(self, name: str) -> None:
+        """
+        Removes a player and their score from every metric.
+        """
+        self.total_score -= self.scores.pop(name)
+        self.active_players -= self.active.pop(name)
+        self.high_scorers.discard(name)
+        del self.order[name]
+
+    @property
+    def total_players(self) -> int:
+        """
+        Number of players.
+        """
+        return len(self.scores)
+
+    @property
+    def avg_score(self) -> float:
+        """
+        Average score, 0 without players.
+        """
+        return self.total_score / len(self.scores) if self.scores else 0
+
+    @property
+    def categories(self) -> dict[str, int]:
+        """
+        Number of players per score category.
+        """
+        high = len(self.high_scorers)
+        return {"high": high, "standard": len(self.scores) - high}
+
+    def top_scorer(self) -> tuple[str, int] | None:
+        """
+        Returns the (name, score) of the best player, the earliest added
+        on ties, or None without players.
+        """
+        while self.heap:
+            score, order, name = self.heap[0]
+            if (self.scores.get(name) == -score
+                    and self.order[name] == order):
+                return name, -score
+            heappop(self.heap)
+        return None
+
+
+def print_file_analytics(path: str) -> None:
+    """
+    Calculates and displays the combined analysis of a CSV file.
+    """
+    try:
+        summary = summarize(read_rows(path))
+    except OSError as e:
+        print(f"Error: cannot read {path}: {e.strerror}")
+        return
+    if not summary["total_players"]:
+        print("No players found.")
+        return
+    print(f"Total players: {summary['total_players']}")
+    print(f"Total score: {summary['total_score']}")
+    print(f"Average score: {summary['avg_score']}")
+    print(f"Active players: {summary['active_players']}")
+    print(f"High scorers (>2000): {summary['high_scorers']}")
+    print(
+        f"Top scorer: {summary['top_scorer']}",
+        f"({summary['max_score']} points)"
+    )
+
+
 def main() -> None:
     """
     Calculates and displays all analytics related to the game.
+
+    With a path argument, analyzes a "name,score,active" CSV file
+    instead of the built-in examples.
     """
     print("=== Game Analytics Dashboard ===")
+    if len(sys.argv) > 1:
+        print_file_analytics(sys.argv[1])
+        return
 
     players = [
         ("bob", 1800),
@@ -54,18 +262,19 @@ def main() -> None:
 
     print("\n=== Combined Analysis ===")
 
-    total_players = len(players)
-    total_score = sum([score for _, score in players])
-    max_score = max([score for _, score in players])
-    avg_score = total_score / total_players
-    top_scorer = [f"{name} ({score} points)"
-                  for name, score in players if score == max_score]
+    rows = ((name, score, active)
+            for (name, score), (_, active) in zip(players, activity))
+    summary = summarize(rows)
+    total_players = summary["total_players"]
+    total_score = summary["total_score"]
+    avg_score = summary["avg_score"]
+    top_scorer = f"{summary['top_scorer']} ({summary['max_score']} points)"
 
     print(f"Total players: {total_players}")
     print(f"Total score: {total_score}")
     print(f"Average score: {avg_score}")
     print(f"Total unique achievements: {len(unique_achievements)}")
-    print(f"Top scorer: {top_scorer[0]}")
+    print(f"Top scorer: {top_scorer}")
 
 
 if __name__ == "__main__":
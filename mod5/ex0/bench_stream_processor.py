@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+
+"""
+Benchmarks for the data processors in stream_processor.py.
+Usage: python3 bench_stream_processor.py [n_items]
+"""
+
+import os
+import sys
+import tempfile
+import time
+from array import array
+from typing import Any, Callable, Tuple
+
+from stream_processor import (
+    NumericProcessor, TextProcessor, LogProcessor, np
+)
+
+
+def timed(label: str, func: Callable[[], Any]) -> float:
+    """
+    Run func once and print how long it took.
+
+    Args:
+        label: Name printed in front of the timing.
+        func: The callable to measure.
+
+    Returns:
+        The elapsed time in seconds.
+    """
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<32} {elapsed:.3f} s")
+    return elapsed
+
+
+def write_log(path: str, n_lines: int) -> None:
+    """
+    Write a synthetic log file with a mix of levels.
+
+    Args:
+        path: Destination file.
+        n_lines: Number of log lines to write.
+    """
+    lines = [
+        "INFO: System ready\n",
+        "ERROR: Connection timeout\n",
+        "WARNING: Disk usage at 85%\n",
+        "INFO: User alice logged in\n"
+    ]
+    with open(path, "w", encoding="utf-8") as file:
+        for i in range(0, n_lines, len(lines)):
+            file.writelines(lines[:n_lines - i])
+
+
+def bench_numeric(n_items: int) -> None:
+    """
+    Time NumericProcessor validation and statistics on each backend.
+
+    Args:
+        n_items: Number of elements in every input.
+    """
+    print(f"=== NumericProcessor ({n_items} items) ===")
+    processor = NumericProcessor()
+    as_list = [float(i % 1000) for i in range(n_items)]
+    as_array = array("d", as_list)
+    inputs = [
+        ("list", as_list),
+        ("array.array", as_array),
+        ("memoryview", memoryview(as_array))
+    ]
+    if np is not None:
+        inputs.append(("numpy", np.asarray(as_array)))
+    for name, data in inputs:
+        timed(f"validate {name}", lambda: processor.validate(data))
+        timed(f"process {name}", lambda: processor.process(data))
+        timed(f"stats {name}", lambda: processor.stats(data))
+
+
+def count_text_loop(data: str) -> Tuple[int, int]:
+    """
+    Reference character-by-character counter, as TextProcessor used to be.
+
+    Args:
+        data: The text to count.
+
+    Returns:
+        A (char_count, word_count) tuple.
+    """
+    char_count = 0
+    word_count = 0
+    in_word = False
+    for char in data:
+        if char == " ":
+            in_word = False
+        else:
+            if not in_word:
+                word_count += 1
+                in_word = True
+        char_count += 1
+    return char_count, word_count
+
+
+def bench_text(n_items: int) -> None:
+    """
+    Compare the character loop with TextProcessor's chunked counter.
+
+    Args:
+        n_items: Number of words in the generated document.
+    """
+    print(f"\n=== TextProcessor ({n_items} words) ===")
+    processor = TextProcessor()
+    words = ["nexus", "stream", "data", "log", "processor"]
+    text = " ".join(words[i % len(words)] for i in range(n_items))
+    chunks = [text[i:i + 65536] for i in range(0, len(text), 65536)]
+    timed("character loop", lambda: count_text_loop(text))
+    timed("count_chunks (one string)", lambda: processor.count_chunks([text]))
+    timed("count_chunks (64K chunks)", lambda: processor.count_chunks(chunks))
+
+
+def bench_log(n_items: int) -> None:
+    """
+    Time LogProcessor level counting on a generated log file.
+
+    Args:
+        n_items: Number of lines in the log file.
+    """
+    print(f"\n=== LogProcessor ({n_items} lines) ===")
+    processor = LogProcessor()
+    fd, path = tempfile.mkstemp(suffix=".log")
+    os.close(fd)
+    try:
+        write_log(path, n_items)
+        for name, func in [("count_file", processor.count_file),
+                           ("scan_file (mmap)", processor.scan_file)]:
+            elapsed = timed(name, lambda: func(path))
+            print(f"{'  throughput':<32} {n_items / elapsed:,.0f} lines/s")
+    finally:
+        os.remove(path)
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000
+    bench_numeric(n)
+    bench_text(n)
+    bench_log(n)
@@ -7,8 +7,44 @@ It defines an abstract DataProcessor class and specialized subclasses
 (Numeric, Text, Log) to demonstrate method overriding and basic polymorphism.
 """
 
-from typing import Any, List
+from typing import (
+    Any, List, Dict, Union, Iterable, Iterator, Tuple, Optional, Pattern
+)
 from abc import ABC, abstractmethod
+from array import array
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat, tee
+import mmap
+import os
+import re
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# array.array typecodes / memoryview formats holding plain numbers
+NUMERIC_TYPECODES = frozenset("bBhHiIlLqQfd")
+
+# Characters read at a time when streaming text from a file
+TEXT_CHUNK_SIZE = 1 << 20
+
+# Buffer size used when streaming log files line by line
+LOG_BUFFER_SIZE = 1 << 20
+
+# Bytes of a memory-mapped log scanned per regex call
+MMAP_WINDOW_SIZE = 1 << 24
+
+# Matches the "LEVEL:" prefix of every line in a mapped log file; the rest
+# of the line is consumed so the scan jumps straight to the next line
+LOG_PREFIX_PATTERN = re.compile(rb"^([^:\n]*):.*", re.MULTILINE)
+
+# Display tag for each known log level; other levels use "[LEVEL]"
+LEVEL_TAGS = {
+    "ERROR": "[ALERT]",
+    "INFO": "[INFO]"
+}
 
 
 class DataProcessor(ABC):
@@ -63,43 +99,129 @@ class DataProcessor(ABC):
 class NumericProcessor(DataProcessor):
     """
     Processor for handling lists of numbers (integers and floats).
+    Also accepts array.array, memoryview and NumPy arrays directly.
     """
 
+    @staticmethod
+    def _array_total(values: Any) -> Union[int, float]:
+        """
+        Sum a NumPy array. Integer sums that could overflow int64 are
+        computed with Python ints instead, so they stay exact.
+
+        Args:
+            values: A one-dimensional NumPy array of numbers.
+
+        Returns:
+            The sum of the numbers.
+        """
+        if values.dtype.kind == "f" or values.size == 0:
+            return values.sum().item()
+        bound = max(-int(values.min()), int(values.max()))
+        if bound * values.size < 2 ** 63:
+            return values.sum().item()
+        return sum(values.tolist())
+
+    def total(self, data: Any) -> Union[int, float]:
+        """
+        Sum the numbers, with NumPy for buffers when it is installed.
+
+        Args:
+            data: A sequence or buffer of numbers.
+
+        Returns:
+            The sum of the numbers, exact for integers.
+        """
+        if np is not None and not isinstance(data, list):
+            return self._array_total(np.asarray(data))
+        return sum(data)
+
+    def stats(self, data: Any) -> Dict[str, Union[int, float]]:
+        """
+        Compute count, sum, average, min, max and variance.
+        Buffers are handed to NumPy when it is installed. Lists use the
+        builtin sum, min and max, which keep integers exact, and NumPy
+        (or one more pass without it) for the variance. These are
+        several passes, but each runs in C and together they beat a
+        single pass written in Python.
+
+        Args:
+            data: A non-empty sequence or buffer of numbers.
+
+        Returns:
+            Dictionary with count, sum, avg, min, max and variance
+            (population variance).
+        """
+        if np is not None and not isinstance(data, list):
+            values = np.asarray(data)
+            total = self._array_total(values)
+            count = values.size
+            return {
+                "count": count,
+                "sum": total,
+                "avg": total / count,
+                "min": values.min().item(),
+                "max": values.max().item(),
+                "variance": values.var().item()
+            }
+        count = len(data)
+        total = sum(data)
+        avg = total / count
+        if np is not None:
+            variance = np.fromiter(data, np.float64, count).var().item()
+        else:
+            variance = sum((num - avg) ** 2 for num in data) / count
+        return {
+            "count": count,
+            "sum": total,
+            "avg": avg,
+            "min": min(data),
+            "max": max(data),
+            "variance": variance
+        }
+
     def process(self, data: Any) -> str:
         """
         Calculate count, sum, and average of a numeric list.
+        Use stats() for min, max and variance as well.
 
         Args:
-            data: A list of numbers (integers or floats).
+            data: A list, array.array, memoryview or NumPy array of
+                numbers.
 
         Returns:
             A formatted string with count, sum, and average stats.
             Returns "Error" if the data is empty or invalid.
         """
-        if not data:
+        count = len(data)
+        if count == 0:
             return "Error"
-        count = 0
-        total = 0
-        for num in data:
-            total += num
-            count += 1
-        avg = total / count
-        return f"Processed {count} numeric values, sum={total}, avg={avg}"
+        total = self.total(data)
+        return (
+            f"Processed {count} numeric values, " +
+            f"sum={total}, avg={total / count}"
+        )
 
     def validate(self, data: Any) -> bool:
         """
-        Check if data is a list containing only integers or floats.
+        Check if data is a list containing only integers or floats,
+        or a one-dimensional buffer with a numeric element type.
 
         Args:
             data: The input data to validate.
 
         Returns:
-            True if data is a list of numbers, False otherwise.
+            True if data holds only numbers, False otherwise.
         """
+        if isinstance(data, array):
+            return data.typecode in NUMERIC_TYPECODES
+        if isinstance(data, memoryview):
+            return data.ndim == 1 and data.format in NUMERIC_TYPECODES
+        if np is not None and isinstance(data, np.ndarray):
+            return data.ndim == 1 and data.dtype.kind in "iuf"
         if not data.__class__ == list:
             return False
         for num in data:
-            if num.__class__ not in [int, float]:
+            if num.__class__ not in (int, float):
                 return False
         return True
 
@@ -109,27 +231,60 @@ class TextProcessor(DataProcessor):
     Processor for handling text strings.
     """
 
-    def process(self, data: Any) -> str:
+    def count_chunks(self, chunks: Iterable[str]) -> Tuple[int, int]:
         """
-        Count characters and words in the text.
+        Count characters and words over a stream of text chunks.
+        Words are runs of non-whitespace (any Unicode whitespace), and a
+        word split across two chunks is only counted once.
 
         Args:
-            data: The input string to analyze.
+            chunks: An iterable of strings, e.g. successive file reads.
 
         Returns:
-            A formatted string with character and word counts.
+            A (char_count, word_count) tuple.
         """
         char_count = 0
         word_count = 0
         in_word = False
-        for char in data:
-            if char == " ":
-                in_word = False
-            else:
-                if not in_word:
-                    word_count += 1
-                    in_word = True
-            char_count += 1
+        for chunk in chunks:
+            if not chunk:
+                continue
+            char_count += len(chunk)
+            word_count += len(chunk.split())
+            if in_word and not chunk[0].isspace():
+                word_count -= 1
+            in_word = not chunk[-1].isspace()
+        return char_count, word_count
+
+    def count_file(self, path: str,
+                   chunk_size: int = TEXT_CHUNK_SIZE) -> Tuple[int, int]:
+        """
+        Count characters and words in a text file without loading it
+        whole into memory.
+
+        Args:
+            path: Path of the file to read.
+            chunk_size: Number of characters read at a time.
+
+        Returns:
+            A (char_count, word_count) tuple.
+        """
+        with open(path, encoding="utf-8") as file:
+            return self.count_chunks(iter(lambda: file.read(chunk_size), ""))
+
+    def process(self, data: Any) -> str:
+        """
+        Count characters and words in the text.
+
+        Args:
+            data: The input string, or an iterable of string chunks.
+
+        Returns:
+            A formatted string with character and word counts.
+        """
+        if isinstance(data, str):
+            data = (data,)
+        char_count, word_count = self.count_chunks(data)
         return f"Processed text: {char_count} characters, {word_count} words"
 
     def validate(self, data: Any) -> bool:
@@ -176,30 +331,233 @@ class LogProcessor(DataProcessor):
         Returns:
             A formatted string with a tag (e.g., [ALERT]) and the message.
         """
-        level_dict = {
-            "ERROR": "[ALERT]",
-            "INFO": "[INFO]"
-        }
-        level = ""
-        message = ""
-        found_sep = False
-        for char in data:
-            if found_sep:
-                if char == " " and message == "":
-                    continue
-                message += char
-            else:
-                if char == ":":
-                    found_sep = True
-                else:
-                    level += char
-        tag = ""
-        try:
-            tag = level_dict[level]
-        except KeyError:
-            tag = f"[{level}]"
+        level, _, message = data.partition(":")
+        message = message.lstrip(" ")
+        tag = LEVEL_TAGS.get(level, f"[{level}]")
         return f"{tag} {level} level detected: {message}"
 
+    def count_levels(self, lines: Iterable[str]) -> Dict[str, int]:
+        """
+        Count log entries per level.
+        Lines without a colon are not log entries and are skipped.
+
+        Args:
+            lines: An iterable of "LEVEL: Message" lines.
+
+        Returns:
+            Dictionary mapping each level to its number of entries.
+        """
+        parts = map(str.partition, lines, repeat(":"))
+        return dict(Counter(level for level, sep, _ in parts if sep))
+
+    def count_file(self, path: str,
+                   buffer_size: int = LOG_BUFFER_SIZE) -> Dict[str, int]:
+        """
+        Count log entries per level in a log file, line by line.
+
+        Args:
+            path: Path of the log file.
+            buffer_size: Size of the read buffer in bytes.
+
+        Returns:
+            Dictionary mapping each level to its number of entries.
+        """
+        with open(path, encoding="utf-8", buffering=buffer_size) as file:
+            return self.count_levels(file)
+
+    def scan_file(self, path: str,
+                  levels: Optional[Iterable[str]] = None) -> Dict[str, int]:
+        """
+        Count log entries per level by scanning a memory-mapped file.
+        The regex runs on the mapped buffer, so no line strings are
+        created and the whole file is never read into memory.
+
+        Args:
+            path: Path of the log file.
+            levels: Only count these levels (default: every level).
+
+        Returns:
+            Dictionary mapping each level to its number of entries.
+        """
+        pattern = level_pattern(levels)
+        counts: Counter = Counter()
+        for mapped, start, end in mapped_windows(path):
+            counts.update(pattern.findall(mapped, start, end))
+        return {level.decode(): count for level, count in counts.items()}
+
+    def scan_offsets(self, path: str,
+                     levels: Optional[Iterable[str]] = None
+                     ) -> Dict[str, List[int]]:
+        """
+        Find the byte offset of every log entry per level by scanning
+        a memory-mapped file.
+
+        Args:
+            path: Path of the log file.
+            levels: Only report these levels (default: every level).
+
+        Returns:
+            Dictionary mapping each level to the offsets of its lines.
+        """
+        pattern = level_pattern(levels)
+        offsets: Dict[str, List[int]] = {}
+        for mapped, start, end in mapped_windows(path):
+            for match in pattern.finditer(mapped, start, end):
+                level = match.group(1).decode()
+                offsets.setdefault(level, []).append(match.start())
+        return offsets
+
+
+def level_pattern(levels: Optional[Iterable[str]] = None) -> Pattern[bytes]:
+    """
+    Build the regex matching the "LEVEL:" prefix of a log line.
+
+    Args:
+        levels: Only match these levels (default: every level).
+
+    Returns:
+        A compiled pattern whose group 1 is the level as bytes.
+    """
+    if levels is None:
+        return LOG_PREFIX_PATTERN
+    names = b"|".join(re.escape(level.encode()) for level in levels)
+    return re.compile(rb"^(" + names + rb"):.*", re.MULTILINE)
+
+
+def mapped_windows(path: str, window: int = MMAP_WINDOW_SIZE
+                   ) -> Iterator[Tuple[mmap.mmap, int, int]]:
+    """
+    Memory-map a file and split it into windows ending on a line break,
+    so a regex scan only materializes one window of results at a time.
+
+    Args:
+        path: Path of the file to map.
+        window: Approximate window size in bytes.
+
+    Yields:
+        (mapped, start, end) tuples covering the whole file.
+    """
+    with open(path, "rb") as file:
+        size = os.fstat(file.fileno()).st_size
+        if size == 0:
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            start = 0
+            while start < size:
+                end = mapped.find(b"\n", min(start + window, size)) + 1
+                if end == 0:
+                    end = size
+                yield mapped, start, end
+                start = end
+
+
+class ProcessorDispatcher:
+    """
+    Routes mixed inputs to the first processor that validates them and
+    runs the processing across a pool of worker processes.
+    """
+
+    def __init__(self, processors: Optional[List[DataProcessor]] = None
+                 ) -> None:
+        """
+        Initialize the dispatcher.
+
+        Args:
+            processors: Candidate processors in priority order. Defaults
+                to numeric, log, then text (logs are also valid text).
+        """
+        if processors is None:
+            processors = [NumericProcessor(), LogProcessor(), TextProcessor()]
+        self.processors = processors
+        self.cache: Dict[Any, DataProcessor] = {}
+
+    def dispatch_key(self, data: Any) -> Any:
+        """
+        Key under which the processor choice for data is cached.
+        Strings are split on the presence of a colon since the same type
+        can be either a log entry or plain text. Lists are keyed on the
+        set of their element types and buffers on their element type,
+        as validation depends on the contents and not only the type.
+
+        Args:
+            data: The input item.
+
+        Returns:
+            A hashable key shared by items that pick the same processor.
+        """
+        if isinstance(data, str):
+            return str, ":" in data
+        if isinstance(data, list):
+            return list, frozenset(map(type, data))
+        if isinstance(data, array):
+            return array, data.typecode
+        if isinstance(data, memoryview):
+            return memoryview, data.format, data.ndim
+        if np is not None and isinstance(data, np.ndarray):
+            return np.ndarray, data.dtype, data.ndim
+        return type(data)
+
+    def select(self, data: Any) -> Optional[DataProcessor]:
+        """
+        Find the processor for data, validating only the first item seen
+        for each dispatch key.
+
+        Args:
+            data: The input item.
+
+        Returns:
+            The chosen processor, or None if none accepts the data.
+        """
+        key = self.dispatch_key(data)
+        processor = self.cache.get(key)
+        if processor is None:
+            for candidate in self.processors:
+                if candidate.validate(data):
+                    processor = self.cache[key] = candidate
+                    break
+        return processor
+
+    def dispatch(self, items: Iterable[Any], workers: Optional[int] = None,
+                 chunksize: int = 1024) -> List[str]:
+        """
+        Process every item with its matching processor in parallel.
+
+        Args:
+            items: An iterable of mixed numeric, text and log inputs.
+            workers: Number of worker processes (default: CPU count).
+                With 1, items are processed in the current process.
+            chunksize: Number of items sent to a worker at a time.
+
+        Returns:
+            The result strings, in the same order as the inputs.
+        """
+        items, keyed = tee(items)
+        processors = map(self.select, keyed)
+        if workers == 1:
+            return list(map(run_processor, processors, items))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(run_processor, processors, items,
+                                     chunksize=chunksize))
+
+
+def run_processor(processor: Optional[DataProcessor], data: Any) -> str:
+    """
+    Process one item in a worker.
+
+    Args:
+        processor: The selected processor, or None if none matched.
+        data: The input item.
+
+    Returns:
+        The processing result, or an error string.
+    """
+    if processor is None:
+        return "Error: Unsupported data"
+    try:
+        return processor.process(data)
+    except (TypeError, ValueError):
+        return "Error"
+
 
 if __name__ == "__main__":
     print("=== CODE NEXUS - DATA PROCESSOR FOUNDATION ===")
@@ -7,8 +7,12 @@ It defines an abstract DataStream class and specialized subclasses
 (Sensor, Transaction, Event) managed by a central StreamProcessor.
 """
 
-from typing import Any, List, Dict, Union, Optional
+from typing import Any, List, Dict, Set, Union, Optional, Type
 from abc import ABC, abstractmethod
+from importlib import import_module
+from importlib.metadata import entry_points
+
+STREAM_ENTRY_POINT_GROUP = "nexus.streams"
 
 
 class DataStream(ABC):
@@ -151,6 +155,102 @@ class EventStream(DataStream):
         )
 
 
+class UnknownStreamTypeError(LookupError):
+    """
+    Error raised when a stream type name cannot be resolved to a
+    DataStream subclass.
+    """
+    pass
+
+
+# Stream type name -> class, or "module:ClassName" path imported on demand
+_STREAM_TYPES: Dict[str, Union[str, Type[DataStream]]] = {
+    "sensor": SensorStream,
+    "transaction": TransactionStream,
+    "event": EventStream,
+}
+
+# Names already looked up without success, so entry points are not
+# scanned again for them
+_UNKNOWN_STREAM_TYPES: Set[str] = set()
+
+
+def register_stream_type(type_name: str,
+                         target: Union[str, Type[DataStream]]) -> None:
+    """
+    Register a stream type under a name.
+
+    Args:
+        type_name: Name used to look the stream type up.
+        target: A DataStream subclass, or a "module:ClassName" path that
+            is only imported the first time the type is used.
+    """
+    _STREAM_TYPES[type_name] = target
+    _UNKNOWN_STREAM_TYPES.discard(type_name)
+
+
+def _load_stream_type(type_name: str) -> Any:
+    """
+    Import the object registered or advertised under a stream type name.
+
+    Args:
+        type_name: Name of the stream type.
+
+    Returns:
+        The imported object, not checked yet.
+
+    Raises:
+        UnknownStreamTypeError: If the name is unknown or its import
+            fails.
+    """
+    target = _STREAM_TYPES.get(type_name)
+    try:
+        if target is None:
+            for entry in entry_points(group=STREAM_ENTRY_POINT_GROUP):
+                if entry.name == type_name:
+                    return entry.load()
+            raise UnknownStreamTypeError(f"unknown stream type {type_name}")
+        if isinstance(target, str):
+            module_name, _, class_name = target.partition(":")
+            return getattr(import_module(module_name), class_name)
+    except (ImportError, AttributeError) as e:
+        raise UnknownStreamTypeError(
+            f"cannot import stream type {type_name}: {e}"
+        ) from e
+    return target
+
+
+def get_stream_type(type_name: str) -> Type[DataStream]:
+    """
+    Resolve a stream type name to its class, importing it if needed.
+    Names missing from the registry are looked up in the
+    "nexus.streams" entry point group before giving up.
+
+    Args:
+        type_name: Name of the registered stream type.
+
+    Returns:
+        The DataStream subclass for this type.
+
+    Raises:
+        UnknownStreamTypeError: If no DataStream subclass can be found
+            under this name.
+    """
+    if type_name in _UNKNOWN_STREAM_TYPES:
+        raise UnknownStreamTypeError(f"unknown stream type {type_name}")
+    try:
+        target = _load_stream_type(type_name)
+        if not (isinstance(target, type) and issubclass(target, DataStream)):
+            raise UnknownStreamTypeError(
+                f"stream type {type_name} is not a DataStream subclass"
+            )
+    except UnknownStreamTypeError:
+        _UNKNOWN_STREAM_TYPES.add(type_name)
+        raise
+    _STREAM_TYPES[type_name] = target
+    return target
+
+
 class StreamProcessor():
     """
     Manager class that handles multiple polymorphic data streams.
@@ -158,6 +258,38 @@ class StreamProcessor():
     def __init__(self) -> None:
         """Initialize the processor with an empty stream registry."""
         self.streams: Dict[str, DataStream] = {}
+        self.pending: Dict[str, str] = {}
+
+    def declare_stream(self, type_name: str, stream_id: str) -> None:
+        """
+        Declare a stream by type name without creating it yet.
+        The stream class is imported and instantiated on first use.
+
+        Args:
+            type_name: Name of a registered stream type.
+            stream_id: The ID the stream will be created with.
+        """
+        self.pending[stream_id] = type_name
+
+    def get_stream(self, stream_id: str) -> DataStream:
+        """
+        Retrieve a stream by ID, creating it if it was only declared.
+
+        Args:
+            stream_id: The ID of the target stream.
+
+        Returns:
+            The DataStream registered under this ID.
+
+        Raises:
+            KeyError: If no stream was added or declared under this ID.
+            UnknownStreamTypeError: If the declared type is unknown.
+        """
+        if stream_id not in self.streams:
+            stream_cls = get_stream_type(self.pending[stream_id])
+            self.streams[stream_id] = stream_cls(stream_id)
+            del self.pending[stream_id]
+        return self.streams[stream_id]
 
     def add_stream(self, stream: DataStream):
         """
@@ -182,9 +314,11 @@ class StreamProcessor():
             The result string from the stream's process_batch method.
         """
         try:
-            stream = self.streams[stream_id]
+            stream = self.get_stream(stream_id)
             filtered_batch = stream.filter_data(data_batch)
             return stream.process_batch(filtered_batch)
+        except UnknownStreamTypeError:
+            return "Error: Unknown stream type"
         except KeyError:
             return "Error: Stream not found"
 